@@ -0,0 +1,29 @@
+"""add cfg_version change counter
+
+Revision ID: b7e3c1d9a2f4
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b7e3c1d9a2f4"
+down_revision = "d4e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cfg_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("INSERT INTO cfg_version (id, version) VALUES (1, 0)")
+
+
+def downgrade() -> None:
+    op.drop_table("cfg_version")
@@ -1,16 +1,16 @@
 from flask import Flask, send_from_directory, jsonify
-import yaml
 import os
 
+from sunny_scada.yaml_cache import load_yaml
+
 app = Flask(__name__, static_folder="static")
 
 # Load processes from the YAML file
 def load_processes():
     config_path = "config/processes.yaml"
     if os.path.exists(config_path):
-        with open(config_path, "r") as file:
-            data = yaml.safe_load(file)
-            return data.get("processes", [])
+        data = load_yaml(config_path) or {}
+        return data.get("processes", [])
     return []
 
 processes = load_processes()
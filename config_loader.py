@@ -1,6 +1,8 @@
-import yaml
+import copy
 import os
 
+from sunny_scada.yaml_cache import load_yaml
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_DIR = os.path.join(BASE_DIR, "config")
 
@@ -23,5 +25,5 @@ def load_config(config_type):
     if not config_path or not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file for {config_type} not found.")
 
-    with open(config_path, "r") as file:
-        return yaml.safe_load(file)
+    # Parsed once per file version; copy so callers may mutate their result freely.
+    return copy.deepcopy(load_yaml(config_path))
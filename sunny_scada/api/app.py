@@ -375,6 +375,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
                         app.state.scheduler.shutdown(wait=False)
                     
                     logger.info("Closing modbus...")
+                    app.state.plc_reader.close()
                     app.state.modbus.close()
                 except Exception as e:
                     logger.exception("Error during service shutdown: %s", e)
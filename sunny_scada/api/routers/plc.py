@@ -473,36 +473,53 @@ def get_plc_data(
             }
         )
 
-    # Log a concise view of the data returned by /plc_data for developer visibility.
-    try:
-        log = logging.getLogger(__name__)
-        for plc in out_plcs:
-            plc_name = str(plc.get("name") or "")
-            # Top-level datapoints (not in containers)
-            for dp in plc.get("datapoints", []) or []:
-                label = dp.get("label")
-                value = dp.get("value")
-                log.info(f"{plc_name} -> {label} -> {value}")
-
-            # Containers
-            for c in plc.get("containers", []) or []:
-                c_label = c.get("name")
-                # Container-level datapoints
-                for dp in c.get("datapoints", []) or []:
-                    label = dp.get("label")
-                    value = dp.get("value")
-                    log.info(f"{c_label} -> {label} -> {value}")
-
-                # Equipment within container
-                for eq in c.get("equipment", []) or []:
-                    eq_label = eq.get("name")
-                    for dp in eq.get("datapoints", []) or []:
-                        label = dp.get("label")
-                        value = dp.get("value")
-                        log.info(f"{c_label} -> {eq_label} -> {label} -> {value}")
-    except Exception:
-        # Ensure logging doesn't break endpoint
-        pass
+    # One summary line per request for operators: datapoint count per PLC.
+    if logger.isEnabledFor(logging.INFO):
+        per_plc = [
+            (
+                str(plc.get("name") or ""),
+                len(plc["datapoints"])
+                + sum(
+                    len(c["datapoints"]) + sum(len(eq["datapoints"]) for eq in c["equipment"])
+                    for c in plc["containers"]
+                ),
+            )
+            for plc in out_plcs
+        ]
+        logger.info(
+            "/plc_data returned %d datapoints from %d PLC(s): %s",
+            sum(n for _, n in per_plc),
+            len(per_plc),
+            ", ".join(f"{name}={n}" for name, n in per_plc),
+        )
+
+    # Per-datapoint detail for developer visibility. This walks every datapoint, so skip it
+    # entirely unless DEBUG is on.
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            for plc in out_plcs:
+                plc_name = str(plc.get("name") or "")
+                # Top-level datapoints (not in containers)
+                for dp in plc.get("datapoints", []) or []:
+                    logger.debug("%s -> %s -> %s", plc_name, dp.get("label"), dp.get("value"))
+
+                # Containers
+                for c in plc.get("containers", []) or []:
+                    c_label = c.get("name")
+                    # Container-level datapoints
+                    for dp in c.get("datapoints", []) or []:
+                        logger.debug("%s -> %s -> %s", c_label, dp.get("label"), dp.get("value"))
+
+                    # Equipment within container
+                    for eq in c.get("equipment", []) or []:
+                        eq_label = eq.get("name")
+                        for dp in eq.get("datapoints", []) or []:
+                            logger.debug(
+                                "%s -> %s -> %s -> %s", c_label, eq_label, dp.get("label"), dp.get("value")
+                            )
+        except Exception:
+            # Ensure logging doesn't break endpoint
+            pass
 
     return {"plcs": out_plcs}
 
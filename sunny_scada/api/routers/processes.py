@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import os
-import yaml
 from fastapi import APIRouter, Depends, HTTPException
 
 from sunny_scada.api.deps import get_settings
 from sunny_scada.api.deps import require_permission
 from sunny_scada.core.settings import Settings
+from sunny_scada.yaml_cache import load_yaml
 
 router = APIRouter(tags=["processes"])
 
@@ -20,8 +20,7 @@ def get_processes(
     if not os.path.exists(path):
         raise HTTPException(status_code=404, detail="Processes configuration file not found.")
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = load_yaml(path) or {}
         processes = data.get("processes", []) or []
         if not processes:
             raise HTTPException(status_code=404, detail="No processes configured.")
@@ -0,0 +1,112 @@
+"""Change counters for the System Configuration tree.
+
+Caches derived from the cfg_* tree (effective access, alarm context names, ...) store the
+version they were built at and treat a different current version as a miss.
+
+Two counters are kept:
+  - config_version(): in-process, bumped from SQLAlchemy session events, so every ORM flush,
+    bulk query.update()/delete() and commit touching the tracked tables invalidates caches
+    without the writers having to know.
+  - stored_config_version(db): the cfg_version row, bumped once per transaction that changes
+    the tracked tables, so caches also notice edits committed by other worker processes.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from typing import Any, Iterable
+
+from sqlalchemy import event, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from .models import CfgAccessGrant, CfgContainer, CfgDataPoint, CfgEquipment, CfgPLC, CfgVersion
+
+# Tables whose rows feed the derived caches: the config tree plus access grants.
+_TRACKED_TABLES = frozenset(
+    m.__tablename__ for m in (CfgAccessGrant, CfgPLC, CfgContainer, CfgEquipment, CfgDataPoint)
+)
+
+# Caches keyed on these counters are also dropped after this many seconds, which bounds
+# staleness from raw SQL edits that bump neither counter.
+CONFIG_CACHE_MAX_AGE_S = 30.0
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE.
+_UPSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+_version = 0
+_version_lock = threading.Lock()
+
+
+def config_version() -> int:
+    """Counter bumped whenever grants or the config tree change in this process."""
+    return _version
+
+
+def bump_config_version() -> None:
+    global _version
+    with _version_lock:
+        _version += 1
+
+
+def stored_config_version(db: Session) -> int:
+    """Database-wide counter bumped by every transaction that changed grants or the tree."""
+    return db.execute(select(CfgVersion.version).where(CfgVersion.id == 1)).scalar() or 0
+
+
+def _bump_stored_version(session: Session) -> None:
+    conn = session.connection()
+    upsert = _UPSERTS.get(conn.dialect.name)
+    if upsert is None:
+        # The row is seeded by the migration and by create_all(), see CfgVersion.
+        conn.execute(update(CfgVersion).where(CfgVersion.id == 1).values(version=CfgVersion.version + 1))
+        return
+    # Atomic even for a table created before it was seeded: concurrent first writers both
+    # end up incrementing instead of racing to insert id=1.
+    stmt = upsert(CfgVersion).values(id=1, version=1)
+    conn.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[CfgVersion.id], set_={"version": CfgVersion.version + 1}
+        )
+    )
+
+
+def _mark_changed(session: Session) -> None:
+    if not session.info.get("config_changed"):
+        session.info["config_changed"] = True
+        _bump_stored_version(session)
+    bump_config_version()
+
+
+def _touches_tracked_tables(objs: Iterable[Any]) -> bool:
+    return any(getattr(o, "__tablename__", None) in _TRACKED_TABLES for o in objs)
+
+
+@event.listens_for(Session, "after_flush")
+def _on_flush(session: Session, flush_context: Any) -> None:
+    if _touches_tracked_tables(itertools.chain(session.new, session.dirty, session.deleted)):
+        _mark_changed(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_orm_execute(state: Any) -> None:
+    # Bulk query.update()/delete() bypass the flush, so catch them here.
+    if (state.is_update or state.is_delete) and state.bind_mapper is not None:
+        if state.bind_mapper.local_table.name in _TRACKED_TABLES:
+            _mark_changed(state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    # Bump again once the change is visible to other sessions, so a cache entry computed from
+    # the old rows between flush and commit is not kept.
+    if session.info.pop("config_changed", False):
+        bump_config_version()
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session: Session) -> None:
+    if session.info.pop("config_changed", False):
+        bump_config_version()
@@ -5,6 +5,7 @@ import uuid
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     CheckConstraint,
     DateTime,
@@ -17,6 +18,7 @@ from sqlalchemy import (
     Text,
     Time,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -1056,3 +1058,22 @@ class CfgAccessGrant(Base):
         UniqueConstraint("user_id", "resource_type", "resource_id", name="uq_cfg_access_grants_user_resource"),
         Index("ix_cfg_access_grants_resource", "resource_type", "resource_id"),
     )
+
+
+class CfgVersion(Base):
+    """Single-row change counter for access grants and the config tree.
+
+    Bumped in the same transaction as any change to those tables (see
+    sunny_scada.db.config_version), so every worker process can tell when its cached
+    effective access is out of date.
+    """
+
+    __tablename__ = "cfg_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0)
+
+
+# Seed the single row wherever the table is created with create_all(), as the migration does,
+# so bumping it never has to insert.
+event.listen(CfgVersion.__table__, "after_create", DDL("INSERT INTO cfg_version (id, version) VALUES (1, 0)"))
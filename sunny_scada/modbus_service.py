@@ -9,8 +9,10 @@ connected/closed sockets repeatedly. Polling (background thread) and write endpo
 also use the same client concurrently, causing connect/close races and intermittent failures.
 
 This module provides:
-- One persistent ModbusTcpClient per PLC (lazy connect).
-- Per-PLC re-entrant lock: reads/writes are serialized per PLC to avoid interleaving requests.
+- One persistent ModbusTcpClient per PLC endpoint (lazy connect); PLC names sharing an
+  ip:port (unit ids behind one gateway) share the socket.
+- Per-PLC re-entrant lock: reads/writes are serialized per PLC (per shared endpoint) to avoid
+  interleaving requests.
 - Automatic reconnect + retry with exponential backoff.
 - Lightweight health state per PLC for /health endpoints and diagnostics.
 
@@ -24,14 +26,16 @@ AsyncModbusService with the same public methods.
 """
 from __future__ import annotations
 
+import itertools
 import logging
+import socket
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from threading import RLock
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-import yaml
+from .yaml_cache import load_yaml
 
 try:
     from pymodbus.client import ModbusTcpClient  # type: ignore
@@ -85,6 +89,21 @@ class ModbusRequestError(ModbusServiceError):
     """Raised when a Modbus request fails (after retries) and raise_on_error=True."""
 
 
+def _enable_keepalive(client: Any) -> None:
+    """Turn on TCP keepalive for a freshly connected client.
+
+    Sockets are long-lived, so keepalive lets the OS notice a silently dropped PLC/gateway
+    connection instead of the next poll discovering it via a read timeout.
+    """
+    sock = getattr(client, "socket", None)
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError as e:  # pragma: no cover
+        logger.debug("Could not enable TCP keepalive: %s", e)
+
+
 def load_plc_configs(config_file: str) -> List[PLCConfig]:
     """Load PLC definitions from a YAML file.
 
@@ -104,25 +123,22 @@ def load_plc_configs(config_file: str) -> List[PLCConfig]:
 
     Any top-level key whose value is a list of dicts with at least (name, ip) is treated as a PLC list.
     """
-    with open(config_file, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f) or {}
+    cfg = load_yaml(config_file) or {}
     if not isinstance(cfg, dict):
         raise ValueError(f"Invalid config file shape (expected dict): {config_file}")
 
     plcs: List[PLCConfig] = []
-    for _, value in cfg.items():
-        if not isinstance(value, list):
+    sections = (value for value in cfg.values() if isinstance(value, list))
+    for item in itertools.chain.from_iterable(sections):
+        if not isinstance(item, dict):
             continue
-        for item in value:
-            if not isinstance(item, dict):
-                continue
-            name = str(item.get("name") or "").strip()
-            ip = str(item.get("ip") or "").strip()
-            if not name or not ip:
-                continue
-            port = int(item.get("port") or 502)
-            unit_id = int(item.get("unit_id") or item.get("slave") or 1)
-            plcs.append(PLCConfig(name=name, ip=ip, port=port, unit_id=unit_id))
+        name = str(item.get("name") or "").strip()
+        ip = str(item.get("ip") or "").strip()
+        if not name or not ip:
+            continue
+        port = int(item.get("port") or 502)
+        unit_id = int(item.get("unit_id") or item.get("slave") or 1)
+        plcs.append(PLCConfig(name=name, ip=ip, port=port, unit_id=unit_id))
 
     # Deduplicate by PLC name (first wins)
     dedup: Dict[str, PLCConfig] = {}
@@ -154,14 +170,21 @@ class ModbusService:
         self._backoff_s = float(backoff_s)
         self._max_backoff_s = float(max_backoff_s)
 
-        self._plcs: Dict[str, PLCConfig] = {p.name: p for p in plcs}
-        self._locks: Dict[str, RLock] = {name: RLock() for name in self._plcs}
-        self._health: Dict[str, PLCHealth] = {name: PLCHealth() for name in self._plcs}
+        self._plcs: Dict[str, PLCConfig] = {}
+        self._locks: Dict[str, RLock] = {}
+        self._health: Dict[str, PLCHealth] = {}
+        self._clients: Dict[str, ModbusTcpClient] = {}
+
+        # PLC names that share an (ip, port) - e.g. several unit ids behind one TCP/serial
+        # gateway - share one client and one lock, so the gateway sees a single socket and
+        # requests on it never interleave. Requests are still addressed by each PLC's unit_id.
+        self._endpoint_clients: Dict[Tuple[str, int], ModbusTcpClient] = {}
+        self._endpoint_locks: Dict[Tuple[str, int], RLock] = {}
 
         # Create clients eagerly, connect lazily.
-        self._clients: Dict[str, ModbusTcpClient] = {}
-        for name, plc in self._plcs.items():
-            self._clients[name] = ModbusTcpClient(plc.ip, port=plc.port, timeout=self._timeout_s)
+        for plc in {p.name: p for p in plcs}.values():
+            self._plcs[plc.name] = plc
+            self._add_plc(plc)
 
         logger.info("ModbusService initialized with %d PLC(s).", len(self._plcs))
 
@@ -174,11 +197,20 @@ class ModbusService:
             if plc.name in self._plcs:
                 continue
             self._plcs[plc.name] = plc
-            self._locks[plc.name] = RLock()
-            self._health[plc.name] = PLCHealth()
-            self._clients[plc.name] = ModbusTcpClient(plc.ip, port=plc.port, timeout=self._timeout_s)
+            self._add_plc(plc)
             logger.info("Registered PLC '%s' (%s:%s).", plc.name, plc.ip, plc.port)
 
+    def _add_plc(self, plc: PLCConfig) -> None:
+        endpoint = (plc.ip, plc.port)
+        client = self._endpoint_clients.get(endpoint)
+        if client is None:
+            client = ModbusTcpClient(plc.ip, port=plc.port, timeout=self._timeout_s)
+            self._endpoint_clients[endpoint] = client
+            self._endpoint_locks[endpoint] = RLock()
+        self._clients[plc.name] = client
+        self._locks[plc.name] = self._endpoint_locks[endpoint]
+        self._health[plc.name] = PLCHealth()
+
     def plc_names(self) -> List[str]:
         return list(self._plcs.keys())
 
@@ -203,12 +235,12 @@ class ModbusService:
 
     def close(self) -> None:
         """Close all Modbus sockets."""
-        for name, client in self._clients.items():
+        for (ip, port), client in self._endpoint_clients.items():
             try:
                 if getattr(client, "is_socket_open", None) and client.is_socket_open():
                     client.close()
             except Exception as e:  # pragma: no cover
-                logger.debug("Error closing PLC '%s' socket: %s", name, e)
+                logger.debug("Error closing %s:%s socket: %s", ip, port, e)
         logger.info("ModbusService sockets closed.")
 
     # ---- internal helpers ----
@@ -244,8 +276,16 @@ class ModbusService:
         time.sleep(delay)
 
     def _ensure_connected_locked(self, plc_name: str, client: ModbusTcpClient) -> bool:
-        # Throttle reconnect attempts a bit when repeatedly failing.
         h = self._health[plc_name]
+        try:
+            # Reuse the open socket; it is only closed after a transport failure.
+            if getattr(client, "is_socket_open", None) and client.is_socket_open():
+                h.connected = True
+                return True
+        except Exception:
+            pass
+
+        # Throttle reconnect attempts a bit when repeatedly failing.
         if h.last_error_ts is not None and h.consecutive_failures > 0:
             since = time.time() - h.last_error_ts
             min_wait = min(self._max_backoff_s, self._backoff_s * (2 ** min(h.consecutive_failures, 5)))
@@ -253,12 +293,11 @@ class ModbusService:
                 return False
 
         try:
-            if getattr(client, "is_socket_open", None) and client.is_socket_open():
-                h.connected = True
-                return True
             ok = bool(client.connect())
             h.connected = ok
-            if not ok:
+            if ok:
+                _enable_keepalive(client)
+            else:
                 self._mark_error(plc_name, "connect() returned False")
             return ok
         except Exception as e:
@@ -297,6 +336,7 @@ class ModbusService:
                         raise last_exc
                     return None
 
+                resp = None
                 try:
                     resp = func(client, uid)
                     if resp is None:
@@ -310,10 +350,13 @@ class ModbusService:
                 except Exception as e:
                     last_exc = e
                     self._mark_error(plc_name, f"{op_name}: {e}")
-                    try:
-                        client.close()  # force reconnect next attempt
-                    except Exception:
-                        pass
+                    # A Modbus exception response (e.g. illegal address) arrived over a healthy
+                    # socket, so keep it; only transport failures force a reconnect.
+                    if resp is None:
+                        try:
+                            client.close()  # force reconnect next attempt
+                        except Exception:
+                            pass
 
                     if attempt < self._retries:
                         self._sleep_backoff(attempt)
@@ -363,13 +406,33 @@ class ModbusService:
         value: int,
         *,
         unit_id: Optional[int] = None,
+        verify: bool = False,
     ) -> bool:
-        """Write a single holding register."""
+        """Write a single holding register (function code 6).
+
+        The FC06 reply echoes the written address and value, so `verify=True` checks that echo
+        instead of reading the register back: verification costs no extra round-trip.
+        """
         def op(client: ModbusTcpClient, uid: int):
             return client.write_register(int(address), int(value), slave=uid)
 
         resp = self._execute(plc_name, "write_register", op, unit_id=unit_id)
-        return resp is not None
+        if resp is None:
+            return False
+        if not verify:
+            return True
+
+        echoed = (getattr(resp, "address", None), getattr(resp, "value", None))
+        if echoed != (int(address), int(value)):
+            logger.warning(
+                "write_register echo mismatch for PLC '%s': sent (%s, %s), got %s",
+                plc_name,
+                address,
+                value,
+                echoed,
+            )
+            return False
+        return True
 
     def read_register(
         self,
@@ -419,23 +482,44 @@ class ModbusService:
         if value not in (0, 1):
             raise ValueError("value must be 0 or 1")
 
+        mask = 1 << bit
+        return self.write_bits_in_holding_register(
+            plc_name,
+            address,
+            mask if value == 1 else 0,
+            0 if value == 1 else mask,
+            unit_id=unit_id,
+            verify=verify,
+        )
+
+    def write_bits_in_holding_register(
+        self,
+        plc_name: str,
+        address: int,
+        set_mask: int,
+        clear_mask: int,
+        *,
+        unit_id: Optional[int] = None,
+        verify: bool = True,
+    ) -> bool:
+        """Set and clear several bits of a holding register in one read-modify-write.
+
+        Bits in `set_mask` are forced to 1 and bits in `clear_mask` to 0; all other bits keep
+        the value read from the PLC. The whole cycle runs under the per-PLC lock and costs two
+        round-trips however many bits change; `verify` checks the write's echo (see write_register).
+        """
+        set_mask = int(set_mask)
+        clear_mask = int(clear_mask)
+        if not (0 <= set_mask <= 0xFFFF and 0 <= clear_mask <= 0xFFFF):
+            raise ValueError("bit masks must be in range 0..0xFFFF")
+        if set_mask & clear_mask:
+            raise ValueError("set_mask and clear_mask must not overlap")
+
         with self.plc_lock(plc_name):
             current = self.read_register(plc_name, address, unit_id=unit_id)
             if current is None:
                 return False
 
-            if value == 1:
-                new_value = current | (1 << bit)
-            else:
-                new_value = current & ~(1 << bit)
+            new_value = (current | set_mask) & ~clear_mask & 0xFFFF
 
-            if not self.write_register(plc_name, address, new_value, unit_id=unit_id):
-                return False
-
-            if not verify:
-                return True
-
-            after = self.read_register(plc_name, address, unit_id=unit_id)
-            if after is None:
-                return False
-            return bool(after & (1 << bit)) == bool(value)
+            return self.write_register(plc_name, address, new_value, unit_id=unit_id, verify=verify)
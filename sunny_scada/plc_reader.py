@@ -1,18 +1,46 @@
 from __future__ import annotations
 
+import copy
+import itertools
 import logging
 import os
 import struct
-from typing import Any, Dict, Optional
-
-import yaml
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, TypeVar
 
 from .data_storage import DataStorage
 from .modbus_service import ModbusService, PLCConfig
-from .scan_plan import TagSpec, build_blocks, build_tag_specs
+from .scan_plan import TYPE_REAL, Block, TagSpec, build_blocks, build_tag_spec, build_tag_specs, group_tags_by_block
+from .yaml_cache import load_yaml
 
 logger = logging.getLogger(__name__)
 
+# Precompiled codecs for REAL decoding, bound once so the hot path skips the format parse and
+# the attribute lookup. Two big-endian words pack straight into the float's 4 bytes.
+_pack_words = struct.Struct(">HH").pack
+_unpack_f32 = struct.Struct(">f").unpack
+_unpack_f32_from = struct.Struct(">f").unpack_from
+
+# Upper bounds on the ad-hoc point caches before they are reset.
+_POINT_SPECS_MAX = 4096
+_POINT_RUNS_MAX = 64
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@lru_cache(maxsize=None)
+def _words_packer(count: int):
+    """Bound `pack` for `count` big-endian registers (block sizes repeat, so this stays tiny)."""
+    return struct.Struct(f">{count}H").pack
+
+
+def _pack_registers(regs: Sequence[int]) -> bytes:
+    """Pack a register list into its big-endian wire bytes in one call."""
+    return _words_packer(len(regs))(*regs)
+
 
 def address_4x_to_pymodbus(address_4x: int) -> int:
     """Convert a 4xxxx address (e.g., 40001) into the address expected by PyModbus.
@@ -47,6 +75,25 @@ def use_block_reads() -> bool:
     return os.getenv("USE_BLOCK_READS", "1").strip() not in ("0", "false", "False", "no", "NO")
 
 
+def max_block_regs() -> int:
+    """Largest register span merged into one block read (MODBUS_MAX_BLOCK_REGS, default 100, max 125)."""
+    return int(os.getenv("MODBUS_MAX_BLOCK_REGS", "100"))
+
+
+def max_gap_regs() -> int:
+    """Largest unused register gap bridged when merging blocks (MODBUS_MAX_GAP_REGS, default 2)."""
+    return int(os.getenv("MODBUS_MAX_GAP_REGS", "2"))
+
+
+def read_workers() -> int:
+    """Max number of PLCs polled concurrently (PLC_READ_WORKERS, default 8).
+
+    Each PLC is still read under its own ModbusService lock, so this only overlaps network
+    round-trips *across* PLCs. Set to 1 to poll serially.
+    """
+    return max(1, int(os.getenv("PLC_READ_WORKERS", "8")))
+
+
 class PLCReader:
     """Reads tags from PLCs using a shared ModbusService.
 
@@ -57,6 +104,8 @@ class PLCReader:
        - A scan plan is built from data_points.yaml
        - Registers are read in contiguous blocks
        - Values are decoded locally
+    3) **PLCs are polled concurrently** on one long-lived thread pool (PLC_READ_WORKERS, default 8),
+       shared by read_plcs_from_config and PollingService via map_plcs(). Call close() on shutdown.
 
     If you need to temporarily fall back to the legacy per-tag reads, set USE_BLOCK_READS=0.
     """
@@ -85,6 +134,17 @@ class PLCReader:
         self._scan_plans: Dict[str, Dict[str, Any]] = {}
         self._build_scan_plans()
 
+        # Ad-hoc point compilation caches (read_data_point / read_data_points), see _compile_point.
+        # Keyed by (plc_name, path): PLCs often reuse point labels with different details.
+        self._point_specs: Dict[tuple[str, tuple[str, ...]], tuple[Dict[str, Any], int, Optional[TagSpec]]] = {}
+        # Runs are keyed by (plc_name, TagSpec ids), so callers alternating between point sets
+        # on one PLC each keep their entry.
+        self._point_runs: Dict[tuple[str, tuple[int, ...]], tuple[tuple[TagSpec, ...], tuple[int, int], tuple]] = {}
+
+        # Created on first concurrent scan and reused, so polling does not spin up threads per cycle.
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
         logger.info(
             "PLCReader initialized (sections=%d, block_reads=%s).",
             len(self.config_data),
@@ -97,8 +157,7 @@ class PLCReader:
 
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """Load PLC configuration from YAML."""
-        with open(config_file, "r", encoding="utf-8") as file:
-            cfg = yaml.safe_load(file) or {}
+        cfg = load_yaml(config_file) or {}
         if not isinstance(cfg, dict):
             raise ValueError("Configuration file must contain a dictionary structure.")
 
@@ -109,38 +168,53 @@ class PLCReader:
 
     def load_data_points(self, points_file: str) -> Dict[str, Any]:
         """Load data points from YAML."""
-        with open(points_file, "r", encoding="utf-8") as file:
-            data = yaml.safe_load(file) or {}
+        data = load_yaml(points_file) or {}
         if not isinstance(data, dict):
             raise ValueError("Data points file must contain a dictionary structure.")
         return data.get("data_points", {}) or {}
 
     def reload(self, *, config_file: Optional[str] = None, points_file: Optional[str] = None) -> None:
-        """Reload config and/or points at runtime."""
+        """Reload config and/or points at runtime.
+
+        Files are parsed through the YAML cache, and scan plans are only rebuilt when a given
+        file's content actually changed, so passing the same files on every poll is cheap.
+        Calling with no arguments always rebuilds the plans (e.g. after tuning env vars).
+        """
+        changed = not (config_file or points_file)
+
         if config_file:
             self.config_file = config_file
-            self.config_data = self.load_config(config_file)
-            self._register_plcs_from_config()
+            config_data = self.load_config(config_file)
+            if config_data != self.config_data:
+                self.config_data = config_data
+                self._register_plcs_from_config()
+                changed = True
 
         if points_file:
             self.points_file = points_file
-            self.data_points = self.load_data_points(points_file)
+            data_points = self.load_data_points(points_file)
+            if data_points is not self.data_points and data_points != self.data_points:
+                self.data_points = data_points
+                changed = True
 
+        if not changed:
+            return
         self._build_scan_plans()
+        self._point_specs.clear()
+        self._point_runs.clear()
 
     def _register_plcs_from_config(self) -> None:
         plcs: list[PLCConfig] = []
-        for _, devices in self.config_data.items():
-            for dev in devices:
-                if not isinstance(dev, dict):
-                    continue
-                name = str(dev.get("name") or "").strip()
-                ip = str(dev.get("ip") or "").strip()
-                if not name or not ip:
-                    continue
-                port = int(dev.get("port") or 502)
-                unit_id = int(dev.get("unit_id") or dev.get("slave") or 1)
-                plcs.append(PLCConfig(name=name, ip=ip, port=port, unit_id=unit_id))
+        for dev in itertools.chain.from_iterable(self.config_data.values()):
+            if not isinstance(dev, dict):
+                continue
+            name = str(dev.get("name") or "").strip()
+            ip = str(dev.get("ip") or "").strip()
+            if not name or not ip:
+                continue
+            port = int(dev.get("port") or 502)
+            unit_id = int(dev.get("unit_id") or dev.get("slave") or 1)
+            plcs.append(PLCConfig(name=name, ip=ip, port=port, unit_id=unit_id))
 
         if plcs:
             self.modbus.register_plcs(plcs)
@@ -150,9 +224,13 @@ class PLCReader:
     # -------------------------
 
     def _build_scan_plans(self) -> None:
-        """Build (tags, blocks) per section for efficient polling."""
-        max_block_regs = int(os.getenv("MODBUS_MAX_BLOCK_REGS", "100"))
-        max_gap_regs = int(os.getenv("MODBUS_MAX_GAP_REGS", "2"))
+        """Build (tags, blocks, runs) per section for efficient polling.
+
+        `runs` pairs each block with its (tag, offset) members so a scan decodes straight from
+        the block's register list without re-deriving which tags live where.
+        """
+        max_block = max_block_regs()
+        max_gap = max_gap_regs()
         extra = real_extra_offset()
 
         plans: Dict[str, Dict[str, Any]] = {}
@@ -160,16 +238,19 @@ class PLCReader:
             if not isinstance(tree, dict):
                 continue
             tags = build_tag_specs(tree, address_4x_to_pymodbus=address_4x_to_pymodbus, real_extra_offset=extra)
-            blocks = build_blocks(tags, max_block_regs=max_block_regs, max_gap_regs=max_gap_regs)
-            plans[section] = {"tags": tags, "blocks": blocks}
+            blocks = build_blocks(tags, max_block_regs=max_block, max_gap_regs=max_gap)
+            # Tuples of frozen specs: the plan is shared read-only by concurrent PLC reads and is
+            # swapped (never mutated) on reload, so no caller ever needs to copy it.
+            runs = tuple(group_tags_by_block(tags, blocks))
+            plans[section] = {"tags": tuple(tags), "blocks": tuple(blocks), "runs": runs}
 
             logger.info(
                 "Scan plan built for section '%s': %d tags -> %d blocks (max_block=%d, max_gap=%d).",
                 section,
                 len(tags),
                 len(blocks),
-                max_block_regs,
-                max_gap_regs,
+                max_block,
+                max_gap,
             )
 
         self._scan_plans = plans
@@ -188,80 +269,69 @@ class PLCReader:
 
     @staticmethod
     def convert_to_float(high_register: int, low_register: int) -> float:
-        combined = (int(high_register) << 16) | int(low_register)
-        return struct.unpack(">f", struct.pack(">I", combined))[0]
+        return _unpack_f32(_pack_words(high_register, low_register))[0]
 
     @staticmethod
-    def _set_nested(root: Dict[str, Any], path: tuple[str, ...], value: Any) -> None:
-        d = root
-        for key in path[:-1]:
-            nxt = d.get(key)
-            if not isinstance(nxt, dict):
-                nxt = {}
-                d[key] = nxt
-            d = nxt
+    def _set_nested(
+        root: Dict[str, Any],
+        path: tuple[str, ...],
+        value: Any,
+        parents: Optional[Dict[tuple[str, ...], Dict[str, Any]]] = None,
+    ) -> None:
+        """Set `value` at `path` under `root`, creating intermediate dicts.
+
+        `parents` memoizes parent-path -> dict for one rebuild, so sibling tags resolve their
+        parent with a single lookup instead of re-walking the `.get()` chain from the root.
+        """
+        parent_path = path[:-1]
+        d = parents.get(parent_path) if parents is not None else None
+        if d is None:
+            d = root
+            for key in parent_path:
+                nxt = d.get(key)
+                if not isinstance(nxt, dict):
+                    nxt = {}
+                    d[key] = nxt
+                d = nxt
+            if parents is not None:
+                parents[parent_path] = d
         d[path[-1]] = value
 
-    def _decode_tag(self, tag: TagSpec, reg_map: Dict[int, int]) -> Optional[Dict[str, Any]]:
-        d = tag.details
-
-        if tag.typ == "INTEGER":
-            v = reg_map.get(tag.read_addr)
-            if v is None:
-                return None
-            return {
-                "description": tag.description,
-                "type": "INTEGER",
-                "value": int(v),
-                "register_address": tag.base_addr,
-            }
-
-        if tag.typ == "REAL":
-            hi = reg_map.get(tag.read_addr)
-            lo = reg_map.get(tag.read_addr + 1)
-            if hi is None or lo is None:
-                return None
-            raw_value = self.convert_to_float(hi, lo)
-            scaled_value = self.scale_value(
-                raw_value,
-                d.get("raw_zero_scale"),
-                d.get("raw_full_scale"),
-                d.get("eng_zero_scale"),
-                d.get("eng_full_scale"),
-            )
-            return {
-                "description": tag.description,
-                "type": "REAL",
-                "raw_value": raw_value,
-                "scaled_value": scaled_value,
-                "register_address": tag.base_addr,
-                "high_register": int(hi),
-                "low_register": int(lo),
-            }
-
-        if tag.typ == "DIGITAL":
-            v = reg_map.get(tag.read_addr)
-            if v is None:
-                return None
-            integer_value = int(v)
-            bit_statuses: Dict[str, Dict[str, Any]] = {}
-            bits_cfg: Dict[str, Any] = d.get("bits", {}) or {}
-
-            for bit_position in range(16):
-                bit_label = f"BIT {bit_position}"
-                bit_desc = bits_cfg.get(bit_label, "UNKNOWN")
-                bit_value = bool(integer_value & (1 << bit_position))
-                bit_statuses[bit_label] = {"description": bit_desc, "value": bit_value}
-
-            return {
-                "description": tag.description,
-                "type": "DIGITAL",
-                "value": bit_statuses,
-                "register_address": tag.base_addr,
-            }
-
-        # Unknown type
-        return None
+    # Decoders take the register list of the read that covers `tag`, the same registers packed
+    # as big-endian bytes, and the tag's register offset. Only REALs read the packed bytes, so
+    # callers pack them only when a REAL is decoded and pass None otherwise.
+    # Registers are already uint16 ints (pymodbus guarantees it and packing would have raised
+    # otherwise), so no coercion or range check is repeated per tag.
+
+    def _decode_integer(self, tag: TagSpec, regs: Sequence[int], buf: Optional[bytes], off: int) -> Optional[Dict[str, Any]]:
+        out = tag.template.copy()
+        out["value"] = regs[off]
+        return out
+
+    def _decode_real(self, tag: TagSpec, regs: Sequence[int], buf: Optional[bytes], off: int) -> Optional[Dict[str, Any]]:
+        raw_value = _unpack_f32_from(buf, off * 2)[0]
+        out = tag.template.copy()
+        out["raw_value"] = raw_value
+        out["scaled_value"] = raw_value * tag.scale_a + tag.scale_b if tag.scaled else raw_value
+        out["high_register"] = regs[off]
+        out["low_register"] = regs[off + 1]
+        return out
+
+    def _decode_digital(self, tag: TagSpec, regs: Sequence[int], buf: Optional[bytes], off: int) -> Optional[Dict[str, Any]]:
+        integer_value = regs[off]
+        out = tag.template.copy()
+        out["value"] = {
+            label: {"description": desc, "value": bool(integer_value & mask)}
+            for label, desc, mask in tag.bits
+        }
+        return out
+
+    # Indexed by TagSpec.type_id (TYPE_INTEGER, TYPE_REAL, TYPE_DIGITAL).
+    _DECODERS = (_decode_integer, _decode_real, _decode_digital)
+
+    def _decode_tag(self, tag: TagSpec, regs: Sequence[int], off: int = 0) -> Optional[Dict[str, Any]]:
+        buf = _pack_registers(regs) if tag.type_id == TYPE_REAL else None
+        return self._DECODERS[tag.type_id](self, tag, regs, buf, off)
 
     # -------------------------
     # Public read API
@@ -277,122 +347,163 @@ class PLCReader:
 
     def read_plc_section(self, plc_name: str, section: str) -> Dict[str, Any]:
         """Read a whole section for a PLC."""
-        tree = self.data_points.get(section, {})
-        if not isinstance(tree, dict) or not tree:
+        plan = self._scan_plans.get(section)
+        if not plan:
             return {}
 
+        tags: tuple[TagSpec, ...] = plan["tags"]
+
         if not use_block_reads():
             # Legacy per-tag read (kept for troubleshooting)
-            return self._read_plc_legacy(plc_name, tree)
+            return self._read_plc_legacy(plc_name, tags)
 
-        plan = self._scan_plans.get(section)
-        if not plan:
-            return {}
+        root: Dict[str, Any] = {}
+        parents: Dict[tuple[str, ...], Dict[str, Any]] = {}
+        for tag, decoded in self._read_runs(plc_name, plan["runs"]):
+            self._set_nested(root, tag.path, decoded, parents)
+        return root
 
-        tags: list[TagSpec] = plan["tags"]
-        blocks = plan["blocks"]
+    def read_data_points(self, plc_name: str, points: Dict[Any, Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+        """Read many ad-hoc tag definitions from one PLC with coalesced block reads.
 
-        reg_map: Dict[int, int] = {}
+        `points` maps a caller-chosen key to tag details (address/type/...); the result maps the
+        same keys to decoded values. Keys whose tag is invalid or whose block read failed are
+        omitted, matching read_data_point returning None.
+        """
+        extra = real_extra_offset()
+        tags: list[TagSpec] = []
+        keys: Dict[tuple[str, ...], Any] = {}
+        for key, details in points.items():
+            if not isinstance(details, dict):
+                continue
+            path = (str(key),)
+            tag = self._compile_point(plc_name, path, details, extra)
+            if tag is None:
+                continue
+            tags.append(tag)
+            keys[path] = key
+
+        out: Dict[Any, Dict[str, Any]] = {}
+        if not use_block_reads():
+            for tag in tags:
+                decoded = self._read_tag(plc_name, tag)
+                if decoded is not None:
+                    out[keys[tag.path]] = decoded
+            return out
+
+        for tag, decoded in self._read_runs(plc_name, self._point_runs_for(plc_name, tags)):
+            out[keys[tag.path]] = decoded
+        return out
+
+    def _compile_point(
+        self, plc_name: str, path: tuple[str, ...], details: Dict[str, Any], extra: int
+    ) -> Optional[TagSpec]:
+        """build_tag_spec for ad-hoc points, reusing the previous TagSpec while `details` is unchanged.
+
+        Callers such as PollingService rebuild equal detail dicts every tick, so the cache is
+        validated by value (one dict comparison) rather than by identity.
+        """
+        cache_key = (plc_name, path)
+        cached = self._point_specs.get(cache_key)
+        if cached is not None and cached[1] == extra and cached[0] == details:
+            return cached[2]
+        tag = build_tag_spec(path, details, address_4x_to_pymodbus=address_4x_to_pymodbus, real_extra_offset=extra)
+        if cached is None and len(self._point_specs) >= _POINT_SPECS_MAX:
+            self._point_specs.clear()
+        self._point_specs[cache_key] = (copy.deepcopy(details), extra, tag)
+        return tag
+
+    def _point_runs_for(self, plc_name: str, tags: list[TagSpec]) -> tuple:
+        """Block runs for one PLC's ad-hoc tags, rebuilt only when the set of TagSpecs changes."""
+        limits = (max_block_regs(), max_gap_regs())
+        cache_key = (plc_name, tuple(map(id, tags)))
+        cached = self._point_runs.get(cache_key)
+        # The entry holds its TagSpecs alive, so a matching key means the very same specs.
+        if cached is not None and cached[1] == limits:
+            return cached[2]
+        ordered = sorted(tags, key=lambda t: (t.read_addr, t.length, t.path))
+        blocks = build_blocks(ordered, max_block_regs=limits[0], max_gap_regs=limits[1])
+        runs = tuple(group_tags_by_block(ordered, blocks))
+        if cached is None and len(self._point_runs) >= _POINT_RUNS_MAX:
+            self._point_runs.clear()
+        self._point_runs[cache_key] = (tuple(tags), limits, runs)
+        return runs
+
+    def _read_runs(
+        self, plc_name: str, runs: Iterable[tuple[Block, tuple[tuple[TagSpec, int], ...]]]
+    ) -> Iterator[tuple[TagSpec, Dict[str, Any]]]:
+        """Read each block, then yield (tag, decoded) for the tags it covers.
+
+        Tags in a failed block are simply absent.
+        """
+        reads: list[tuple[tuple[tuple[TagSpec, int], ...], Sequence[int]]] = []
 
         # Hold the PLC lock for the entire scan so writes cannot interleave.
         with self.modbus.plc_lock(plc_name):
-            for block in blocks:
+            for block, members in runs:
                 regs = self.modbus.read_holding_registers(plc_name, block.start, block.count)
                 if regs is None or len(regs) != block.count:
                     continue
-                for i, val in enumerate(regs):
-                    reg_map[block.start + i] = int(val)
-
-        # Decode and rebuild nested structure
+                reads.append((members, regs))
+
+        # Decode each tag straight from its block's registers.
+        decoders = self._DECODERS
+        for members, regs in reads:
+            buf: Optional[bytes] = None
+            for tag, off in members:
+                if buf is None and tag.type_id == TYPE_REAL:
+                    buf = _pack_registers(regs)
+                decoded = decoders[tag.type_id](self, tag, regs, buf, off)
+                if decoded is not None:
+                    yield tag, decoded
+
+    def _read_plc_legacy(self, plc_name: str, tags: Iterable[TagSpec]) -> Dict[str, Any]:
+        """Fallback: read the precompiled tags one-by-one (slow; use only for troubleshooting)."""
         root: Dict[str, Any] = {}
+        parents: Dict[tuple[str, ...], Dict[str, Any]] = {}
         for tag in tags:
-            decoded = self._decode_tag(tag, reg_map)
-            if decoded is None:
-                continue
-            self._set_nested(root, tag.path, decoded)
+            decoded = self._read_tag(plc_name, tag)
+            if decoded is not None:
+                self._set_nested(root, tag.path, decoded, parents)
         return root
 
-    def _read_plc_legacy(self, plc_name: str, data_points: Dict[str, Any]) -> Dict[str, Any]:
-        """Fallback: read tags one-by-one (slow; use only for troubleshooting)."""
-        plc_data: Dict[str, Any] = {}
-        for point_name, point_details in (data_points or {}).items():
-            if isinstance(point_details, dict) and "address" not in point_details:
-                plc_data[point_name] = self._read_plc_legacy(plc_name, point_details)
-                continue
-
-            decoded = self._read_leaf_legacy(plc_name, point_name, point_details)
-            if decoded is not None:
-                plc_data[point_name] = decoded
-        return plc_data
+    def _read_tag(self, plc_name: str, tag: TagSpec) -> Optional[Dict[str, Any]]:
+        """Read and decode a single tag with its own Modbus request."""
+        regs = self.modbus.read_holding_registers(plc_name, tag.read_addr, tag.length)
+        if not regs or len(regs) != tag.length:
+            return None
+        return self._decode_tag(tag, regs)
 
     def _read_leaf_legacy(self, plc_name: str, point_name: str, point_details: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         if not isinstance(point_details, dict):
             return None
 
-        address_4x = point_details.get("address")
-        data_type = point_details.get("type")
-        description = point_details.get("description")
-
-        if not address_4x or not data_type:
+        tag = self._compile_point(plc_name, (str(point_name),), point_details, real_extra_offset())
+        if tag is None:
             return None
+        return self._read_tag(plc_name, tag)
 
-        base_addr = address_4x_to_pymodbus(int(address_4x))
-
-        if data_type == "INTEGER":
-            regs = self.modbus.read_holding_registers(plc_name, base_addr, 1)
-            if not regs:
-                return None
-            return {
-                "description": description,
-                "type": "INTEGER",
-                "value": int(regs[0]),
-                "register_address": base_addr,
-            }
-
-        if data_type == "REAL":
-            start = base_addr + real_extra_offset()
-            regs = self.modbus.read_holding_registers(plc_name, start, 2)
-            if not regs or len(regs) != 2:
-                return None
-            raw_value = self.convert_to_float(regs[0], regs[1])
-            scaled_value = self.scale_value(
-                raw_value,
-                point_details.get("raw_zero_scale"),
-                point_details.get("raw_full_scale"),
-                point_details.get("eng_zero_scale"),
-                point_details.get("eng_full_scale"),
-            )
-            return {
-                "description": description,
-                "type": "REAL",
-                "raw_value": raw_value,
-                "scaled_value": scaled_value,
-                "register_address": base_addr,
-                "high_register": int(regs[0]),
-                "low_register": int(regs[1]),
-            }
-
-        if data_type == "DIGITAL":
-            regs = self.modbus.read_holding_registers(plc_name, base_addr, 1)
-            if not regs:
-                return None
-            integer_value = int(regs[0])
-            bit_statuses: Dict[str, Dict[str, Any]] = {}
-            bits_cfg: Dict[str, Any] = point_details.get("bits", {}) or {}
-            for bit_position in range(16):
-                bit_label = f"BIT {bit_position}"
-                bit_desc = bits_cfg.get(bit_label, "UNKNOWN")
-                bit_value = bool(integer_value & (1 << bit_position))
-                bit_statuses[bit_label] = {"description": bit_desc, "value": bit_value}
-            return {
-                "description": description,
-                "type": "DIGITAL",
-                "value": bit_statuses,
-                "register_address": base_addr,
-            }
-
-        logger.warning("Unsupported data type '%s' for '%s'.", data_type, point_name)
-        return None
+    def map_plcs(self, fn: Callable[[T], R], items: Sequence[T]) -> list[R]:
+        """Apply `fn` to each item (one per PLC) concurrently, returning results in order.
+
+        PLC reads are network-bound and the Modbus client releases the GIL while waiting, so
+        overlapping PLCs cuts a cycle from sum(latency) to roughly max(latency). Runs inline
+        when PLC_READ_WORKERS=1 or there is only one item.
+        """
+        if len(items) <= 1 or read_workers() <= 1:
+            return [fn(item) for item in items]
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=read_workers(), thread_name_prefix="plc-read")
+            pool = self._pool
+        return list(pool.map(fn, items))
+
+    def close(self) -> None:
+        """Shut down the read thread pool (the ModbusService is closed by its owner)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def read_plcs_from_config(self, config_file: Optional[str] = None, data_points_file: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Read all PLCs as defined in the configuration.
@@ -406,24 +517,24 @@ class PLCReader:
             if config_file or data_points_file:
                 self.reload(config_file=config_file, points_file=data_points_file)
 
-            all_device_data: Dict[str, Any] = {}
-
+            jobs: list[tuple[str, str]] = []
             for section, devices in self.config_data.items():
-                section_data: Dict[str, Any] = {}
                 for device in devices:
                     if not isinstance(device, dict):
                         continue
                     plc_name = device.get("name")
                     if not plc_name:
                         continue
+                    jobs.append((section, str(plc_name)))
 
-                    device_data = self.read_plc_section(str(plc_name), section)
-                    section_data[str(plc_name)] = device_data
+            results = self.map_plcs(lambda job: self.read_plc_section(job[1], job[0]), jobs)
 
-                    if self.storage:
-                        self.storage.update_data(str(plc_name), device_data)
+            all_device_data: Dict[str, Any] = {section: {} for section in self.config_data}
+            for (section, plc_name), device_data in zip(jobs, results):
+                all_device_data[section][plc_name] = device_data
 
-                all_device_data[section] = section_data
+                if self.storage:
+                    self.storage.update_data(plc_name, device_data)
 
             return all_device_data
 
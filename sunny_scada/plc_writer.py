@@ -45,6 +45,28 @@ class PLCWriter:
             verify=verify,
         )
 
+    def bit_write_signals_batch(
+        self,
+        plc_name: str,
+        register_address_4x: int,
+        set_bits: int,
+        clear_bits: int,
+        *,
+        verify: bool = True,
+    ) -> bool:
+        """Set/clear several bits of one 4xxxx holding register in a single read-modify-write.
+
+        `set_bits` and `clear_bits` are bit masks (e.g. 0b0101 sets bits 0 and 2).
+        """
+        adjusted = address_4x_to_pymodbus(int(register_address_4x))
+        return self.modbus.write_bits_in_holding_register(
+            plc_name,
+            adjusted,
+            int(set_bits),
+            int(clear_bits),
+            verify=verify,
+        )
+
     def write_register(
         self,
         plc_name: str,
@@ -53,10 +75,10 @@ class PLCWriter:
         *,
         verify: bool = False,
     ) -> bool:
-        """Write a full register value (not bitwise)."""
+        """Write a full register value (not bitwise).
+
+        `verify` checks the device's FC06 echo rather than reading the register back, so it
+        adds no round-trip and callers can afford to set it.
+        """
         adjusted = address_4x_to_pymodbus(int(register_address_4x))
-        ok = self.modbus.write_register(plc_name, adjusted, int(value))
-        if not ok or not verify:
-            return ok
-        after = self.modbus.read_register(plc_name, adjusted)
-        return after == int(value)
+        return self.modbus.write_register(plc_name, adjusted, int(value), verify=verify)
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+# Integer type ids so the poll loop dispatches by index instead of comparing strings.
+TYPE_INTEGER = 0
+TYPE_REAL = 1
+TYPE_DIGITAL = 2
+TYPE_IDS = {"INTEGER": TYPE_INTEGER, "REAL": TYPE_REAL, "DIGITAL": TYPE_DIGITAL}
+
+# Protocol limit for one Read Holding Registers (FC3) request: 125 registers / 250 data bytes.
+MODBUS_MAX_READ_REGS = 125
+
+SCALE_KEYS = ("raw_zero_scale", "raw_full_scale", "eng_zero_scale", "eng_full_scale")
+
+
+@dataclass(frozen=True, slots=True)
 class TagSpec:
     """A leaf tag from data_points.yaml, flattened with its path.
 
@@ -17,6 +31,17 @@ class TagSpec:
         This is kept for backward-compatible output fields like `register_address`.
     length:
         Number of 16-bit holding registers to read (1 for INTEGER/DIGITAL, 2 for REAL).
+    type_id:
+        One of TYPE_INTEGER / TYPE_REAL / TYPE_DIGITAL (the integer form of `typ`).
+    scaled, scale_a, scale_b:
+        REAL scaling folded into `scaled = scale_a * raw + scale_b`; `scaled` is False when the tag
+        has no (valid) scaling, so the poll loop can skip the arithmetic.
+    bits:
+        DIGITAL only: one (label, description, mask) per bit 0..15, resolved from the `bits`
+        mapping at load time so the poll loop does no label formatting or lookups.
+    template:
+        The decoded-value dict with its static fields (description, type, register_address)
+        already filled in; the poll loop copies it and sets only the live values.
     """
     path: Tuple[str, ...]
     typ: str
@@ -26,9 +51,15 @@ class TagSpec:
     base_addr: int
     read_addr: int
     length: int
+    type_id: int
+    scaled: bool = False
+    scale_a: float = 1.0
+    scale_b: float = 0.0
+    bits: Tuple[Tuple[str, Any, int], ...] = ()
+    template: Dict[str, Any] = field(default_factory=dict, compare=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Block:
     start: int
     count: int
@@ -37,17 +68,133 @@ class Block:
 def flatten_points(tree: Dict[str, Any], *, prefix: Tuple[str, ...] = ()) -> List[Tuple[Tuple[str, ...], Dict[str, Any]]]:
     """Flatten a nested data_points tree into leaf nodes.
 
-    A leaf is any dict that has both 'address' and 'type'.
+    A leaf is any dict that has both 'address' and 'type'. The walk uses an explicit stack of
+    item iterators (no recursion), yielding leaves in the same depth-first order as the YAML.
     """
     out: List[Tuple[Tuple[str, ...], Dict[str, Any]]] = []
-    for k, v in (tree or {}).items():
-        if isinstance(v, dict) and "address" in v and "type" in v:
-            out.append((prefix + (str(k),), v))
-        elif isinstance(v, dict):
-            out.extend(flatten_points(v, prefix=prefix + (str(k),)))
+    stack = [(prefix, iter((tree or {}).items()))]
+    while stack:
+        path, items = stack[-1]
+        for k, v in items:
+            if not isinstance(v, dict):
+                continue
+            child = path + (str(k),)
+            if "address" in v and "type" in v:
+                out.append((child, v))
+            else:
+                stack.append((child, iter(v.items())))
+                break
+        else:
+            stack.pop()
     return out
 
 
+def compile_scaling(details: Dict[str, Any]) -> Tuple[float, float] | None:
+    """Precompute the affine coefficients (a, b) of a REAL tag's linear scaling.
+
+    `((raw - rzs) / (rfs - rzs)) * (efs - ezs) + ezs` is rewritten as `a * raw + b` so the
+    poll loop does one multiply and one add instead of re-reading four scale keys.
+    Returns None (no scaling) when any of SCALE_KEYS is missing or the raw span is zero,
+    matching `PLCReader.scale_value`.
+    """
+    try:
+        raw_zero, raw_full, eng_zero, eng_full = (details.get(k) for k in SCALE_KEYS)
+        if raw_zero is None or raw_full is None or eng_zero is None or eng_full is None:
+            return None
+        raw_zero, raw_full = float(raw_zero), float(raw_full)
+        eng_zero, eng_full = float(eng_zero), float(eng_full)
+    except (TypeError, ValueError):
+        return None
+
+    if raw_full == raw_zero:
+        return None
+    a = (eng_full - eng_zero) / (raw_full - raw_zero)
+    return a, eng_zero - a * raw_zero
+
+
+def compile_bits(details: Dict[str, Any]) -> Tuple[Tuple[str, Any, int], ...]:
+    """Resolve a DIGITAL tag's 16 bit labels ("BIT 0".."BIT 15"), descriptions and masks."""
+    bits_cfg = details.get("bits") or {}
+    if not isinstance(bits_cfg, dict):
+        bits_cfg = {}
+    return tuple((f"BIT {pos}", bits_cfg.get(f"BIT {pos}", "UNKNOWN"), 1 << pos) for pos in range(16))
+
+
+def compile_template(type_id: int, typ: str, description: Any, base_addr: int) -> Dict[str, Any]:
+    """Build the per-tag output dict with live fields set to None (key order is the API order)."""
+    if type_id == TYPE_REAL:
+        return {
+            "description": description,
+            "type": typ,
+            "raw_value": None,
+            "scaled_value": None,
+            "register_address": base_addr,
+            "high_register": None,
+            "low_register": None,
+        }
+    return {"description": description, "type": typ, "value": None, "register_address": base_addr}
+
+
+def build_tag_spec(
+    path: Tuple[str, ...],
+    details: Dict[str, Any],
+    *,
+    address_4x_to_pymodbus,
+    real_extra_offset: int,
+) -> TagSpec | None:
+    """Compile one leaf definition into a TagSpec (None if address/type are missing or invalid)."""
+    try:
+        addr_4x = int(details["address"])
+        typ = str(details["type"])
+    except Exception:
+        return None
+    if not addr_4x or not typ:
+        return None
+
+    type_id = TYPE_IDS.get(typ)
+    if type_id is None:
+        logger.warning("Unsupported data type '%s' for '%s'.", typ, "/".join(path))
+        return None
+
+    base_addr = int(address_4x_to_pymodbus(addr_4x))
+    scaling = None
+    if type_id == TYPE_REAL:
+        read_addr = base_addr + int(real_extra_offset)
+        length = 2
+        scaling = compile_scaling(details)
+    else:
+        read_addr = base_addr
+        length = 1
+
+    # Validate once here so a mis-typed address (e.g. 30001 or 1) is rejected at load time
+    # instead of failing as a Modbus exception on every poll.
+    if read_addr < 0 or read_addr + length > 0x10000:
+        logger.warning(
+            "Skipping '%s': address %s is outside the 4xxxx holding-register range.",
+            "/".join(path),
+            addr_4x,
+        )
+        return None
+
+    description = details.get("description")
+    return TagSpec(
+        path=path,
+        typ=typ,
+        description=description,
+        details=details,
+        address_4x=addr_4x,
+        base_addr=base_addr,
+        read_addr=read_addr,
+        length=length,
+        type_id=type_id,
+        scaled=scaling is not None,
+        scale_a=scaling[0] if scaling else 1.0,
+        scale_b=scaling[1] if scaling else 0.0,
+        bits=compile_bits(details) if type_id == TYPE_DIGITAL else (),
+        template=compile_template(type_id, typ, description, base_addr),
+    )
+
+
 def build_tag_specs(
     tree: Dict[str, Any],
     *,
@@ -57,32 +204,14 @@ def build_tag_specs(
     """Build TagSpec objects from a section tree."""
     tags: List[TagSpec] = []
     for path, details in flatten_points(tree):
-        try:
-            addr_4x = int(details["address"])
-            typ = str(details["type"])
-        except Exception:
-            continue
-
-        base_addr = int(address_4x_to_pymodbus(addr_4x))
-        if typ == "REAL":
-            read_addr = base_addr + int(real_extra_offset)
-            length = 2
-        else:
-            read_addr = base_addr
-            length = 1
-
-        tags.append(
-            TagSpec(
-                path=path,
-                typ=typ,
-                description=details.get("description"),
-                details=details,
-                address_4x=addr_4x,
-                base_addr=base_addr,
-                read_addr=read_addr,
-                length=length,
-            )
+        tag = build_tag_spec(
+            path,
+            details,
+            address_4x_to_pymodbus=address_4x_to_pymodbus,
+            real_extra_offset=real_extra_offset,
         )
+        if tag is not None:
+            tags.append(tag)
 
     # Sort by read address for deterministic block building
     tags.sort(key=lambda t: (t.read_addr, t.length, t.path))
@@ -100,10 +229,15 @@ def build_blocks(
     Blocks are merged as long as:
       - the gap between the end of the current block and the next tag start is <= max_gap_regs
       - the resulting block size stays <= max_block_regs
+
+    max_block_regs is clamped to MODBUS_MAX_READ_REGS, so a mis-tuned MODBUS_MAX_BLOCK_REGS
+    cannot produce requests every PLC would reject.
     """
     if not tags:
         return []
 
+    max_block_regs = max(2, min(int(max_block_regs), MODBUS_MAX_READ_REGS))
+
     blocks: List[Block] = []
 
     block_start = tags[0].read_addr
@@ -126,3 +260,21 @@ def build_blocks(
 
     blocks.append(Block(start=block_start, count=block_end - block_start + 1))
     return blocks
+
+
+def group_tags_by_block(tags: List[TagSpec], blocks: List[Block]) -> List[Tuple[Block, Tuple[Tuple[TagSpec, int], ...]]]:
+    """Pair each block with the tags it covers and their register offset inside the block.
+
+    `tags` must be sorted as returned by build_tag_specs and `blocks` built from them, so every
+    tag falls entirely inside exactly one block and the blocks can be consumed in order.
+    """
+    runs: List[Tuple[Block, Tuple[Tuple[TagSpec, int], ...]]] = []
+    i = 0
+    for block in blocks:
+        end = block.start + block.count
+        members: List[Tuple[TagSpec, int]] = []
+        while i < len(tags) and tags[i].read_addr + tags[i].length <= end:
+            members.append((tags[i], tags[i].read_addr - block.start))
+            i += 1
+        runs.append((block, tuple(members)))
+    return runs
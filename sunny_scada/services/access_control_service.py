@@ -1,37 +1,47 @@
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
-from typing import Dict, Iterable, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple
 
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from sunny_scada.db.config_version import CONFIG_CACHE_MAX_AGE_S, config_version, stored_config_version
 from sunny_scada.db.models import CfgAccessGrant, CfgContainer, CfgDataPoint, CfgEquipment, User
 
 
 RESOURCE_TYPES = ("plc", "container", "equipment", "datapoint")
 ACCESS_LEVELS = ("read", "write")
 
+# Cached EffectiveAccess entries are also dropped after this many seconds. Edits made through
+# the ORM, in any worker, invalidate the cache at once via the cfg_version row; this only
+# bounds staleness from raw SQL edits that bypass it.
+ACCESS_CACHE_MAX_AGE_S = CONFIG_CACHE_MAX_AGE_S
 
-@dataclass
+
+@dataclass(frozen=True)
 class EffectiveAccess:
     """Computed access sets for a user.
 
     This is allow-only RBAC.
     - write implies read
+
+    Instances are cached and shared between callers, so the sets are frozen.
     """
 
-    read_plc_ids: Set[int]
-    write_plc_ids: Set[int]
+    read_plc_ids: FrozenSet[int]
+    write_plc_ids: FrozenSet[int]
 
-    read_container_ids: Set[int]
-    write_container_ids: Set[int]
+    read_container_ids: FrozenSet[int]
+    write_container_ids: FrozenSet[int]
 
-    read_equipment_ids: Set[int]
-    write_equipment_ids: Set[int]
+    read_equipment_ids: FrozenSet[int]
+    write_equipment_ids: FrozenSet[int]
 
-    read_datapoint_ids: Set[int]
-    write_datapoint_ids: Set[int]
+    read_datapoint_ids: FrozenSet[int]
+    write_datapoint_ids: FrozenSet[int]
 
     def can_read(self, resource_type: str, resource_id: int) -> bool:
         if resource_type == "plc":
@@ -56,8 +66,101 @@ class EffectiveAccess:
         return False
 
 
+@dataclass(frozen=True)
+class _ConfigTree:
+    """Parent/child maps of the config tree, shared read-only between access computations."""
+
+    containers_by_plc: Dict[int, Set[int]]
+    container_to_plc: Dict[int, int]
+    equipment_by_container: Dict[int, Set[int]]
+    equipment_to_container: Dict[int, int]
+    datapoints_by_owner: Dict[Tuple[str, int], Set[int]]
+    dp_to_owner: Dict[int, Tuple[str, int]]
+
+
 class AccessControlService:
-    """RBAC + per-user overrides for the DB-backed System Configuration tree."""
+    """RBAC + per-user overrides for the DB-backed System Configuration tree.
+
+    Effective access is cached per principal and reused until grants or the config tree
+    change (see sunny_scada.db.config_version) or the entry is older than
+    ACCESS_CACHE_MAX_AGE_S. Both the in-process counter and the cfg_version row are checked,
+    so changes committed by other workers are seen on the next call. The parent/child maps
+    of the tree are cached the same way, so a miss for one principal does not re-read the
+    whole tree.
+    """
+
+    def __init__(self) -> None:
+        self._cache_lock = threading.Lock()
+        self._access_cache: Dict[Tuple[Any, ...], Tuple[Tuple[int, int], float, EffectiveAccess]] = {}
+        self._tree: Optional[Tuple[Tuple[int, int], float, _ConfigTree]] = None
+
+    def invalidate_cache(self) -> None:
+        with self._cache_lock:
+            self._access_cache.clear()
+            self._tree = None
+
+    @staticmethod
+    def _versions(db: Session) -> Tuple[int, int]:
+        # Local counter first: it also covers flushed but uncommitted changes in this process.
+        return config_version(), stored_config_version(db)
+
+    def _cached_access(self, db: Session, key: Tuple[Any, ...], compute) -> EffectiveAccess:
+        version = self._versions(db)
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._access_cache.get(key)
+        if hit is not None and hit[0] == version and now - hit[1] < ACCESS_CACHE_MAX_AGE_S:
+            return hit[2]
+
+        ea = compute()
+        with self._cache_lock:
+            self._access_cache[key] = (version, now, ea)
+        return ea
+
+    def _config_tree(self, db: Session) -> _ConfigTree:
+        """Relationship maps for the entire tree, rebuilt under the same rules as the access cache."""
+        version = self._versions(db)
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._tree
+        if hit is not None and hit[0] == version and now - hit[1] < ACCESS_CACHE_MAX_AGE_S:
+            return hit[2]
+
+        containers_rows = db.query(CfgContainer.id, CfgContainer.plc_id).all()
+        equipment_rows = db.query(CfgEquipment.id, CfgEquipment.container_id).all()
+        dp_rows = db.query(CfgDataPoint.id, CfgDataPoint.owner_type, CfgDataPoint.owner_id).all()
+
+        # Integer/String columns already come back as int/str, so rows are used as-is.
+        containers_by_plc: Dict[int, Set[int]] = {}
+        container_to_plc: Dict[int, int] = {}
+        for cid, plc_id in containers_rows:
+            container_to_plc[cid] = plc_id
+            containers_by_plc.setdefault(plc_id, set()).add(cid)
+
+        equipment_by_container: Dict[int, Set[int]] = {}
+        equipment_to_container: Dict[int, int] = {}
+        for eid, container_id in equipment_rows:
+            equipment_to_container[eid] = container_id
+            equipment_by_container.setdefault(container_id, set()).add(eid)
+
+        datapoints_by_owner: Dict[Tuple[str, int], Set[int]] = {}
+        dp_to_owner: Dict[int, Tuple[str, int]] = {}
+        for dp_id, owner_type, owner_id in dp_rows:
+            key = (owner_type, owner_id)
+            datapoints_by_owner.setdefault(key, set()).add(dp_id)
+            dp_to_owner[dp_id] = key
+
+        tree = _ConfigTree(
+            containers_by_plc=containers_by_plc,
+            container_to_plc=container_to_plc,
+            equipment_by_container=equipment_by_container,
+            equipment_to_container=equipment_to_container,
+            datapoints_by_owner=datapoints_by_owner,
+            dp_to_owner=dp_to_owner,
+        )
+        with self._cache_lock:
+            self._tree = (version, now, tree)
+        return tree
 
     # -----------------
     # Grants CRUD
@@ -189,29 +292,13 @@ class AccessControlService:
     def _effective_access_from_grants(self, db: Session, grants: list[CfgAccessGrant]) -> EffectiveAccess:
         """Compute effective access from a pre-filtered list of grants."""
 
-        # Build lightweight relationship maps (entire graph).
-        containers_rows = db.query(CfgContainer.id, CfgContainer.plc_id).all()
-        equipment_rows = db.query(CfgEquipment.id, CfgEquipment.container_id).all()
-        dp_rows = db.query(CfgDataPoint.id, CfgDataPoint.owner_type, CfgDataPoint.owner_id).all()
-
-        containers_by_plc: Dict[int, Set[int]] = {}
-        container_to_plc: Dict[int, int] = {}
-        for cid, plc_id in containers_rows:
-            container_to_plc[int(cid)] = int(plc_id)
-            containers_by_plc.setdefault(int(plc_id), set()).add(int(cid))
-
-        equipment_by_container: Dict[int, Set[int]] = {}
-        equipment_to_container: Dict[int, int] = {}
-        for eid, container_id in equipment_rows:
-            equipment_to_container[int(eid)] = int(container_id)
-            equipment_by_container.setdefault(int(container_id), set()).add(int(eid))
-
-        datapoints_by_owner: Dict[Tuple[str, int], Set[int]] = {}
-        dp_to_owner: Dict[int, Tuple[str, int]] = {}
-        for dp_id, owner_type, owner_id in dp_rows:
-            key = (str(owner_type), int(owner_id))
-            datapoints_by_owner.setdefault(key, set()).add(int(dp_id))
-            dp_to_owner[int(dp_id)] = (str(owner_type), int(owner_id))
+        tree = self._config_tree(db)
+        containers_by_plc = tree.containers_by_plc
+        container_to_plc = tree.container_to_plc
+        equipment_by_container = tree.equipment_by_container
+        equipment_to_container = tree.equipment_to_container
+        datapoints_by_owner = tree.datapoints_by_owner
+        dp_to_owner = tree.dp_to_owner
 
         read_plc: Set[int] = set()
         write_plc: Set[int] = set()
@@ -222,11 +309,7 @@ class AccessControlService:
         read_dp: Set[int] = set()
         write_dp: Set[int] = set()
 
-        def add_ids(target_read: Set[int], target_write: Set[int], ids: Iterable[int], level: str) -> None:
-            for rid in ids:
-                target_read.add(int(rid))
-                if level == "write":
-                    target_write.add(int(rid))
+        empty: frozenset[int] = frozenset()
 
         for g in grants:
             rtype = str(g.resource_type)
@@ -234,45 +317,43 @@ class AccessControlService:
             level = str(g.access_level)
             include = bool(g.include_descendants)
 
+            # Write grants only fill the write sets; "write implies read" is applied below.
+            if level == "write":
+                plcs, containers, equipment, datapoints = write_plc, write_container, write_equipment, write_dp
+            else:
+                plcs, containers, equipment, datapoints = read_plc, read_container, read_equipment, read_dp
+
             if rtype == "plc":
-                add_ids(read_plc, write_plc, [rid], level)
+                plcs.add(rid)
                 if include:
-                    c_ids = containers_by_plc.get(rid, set())
-                    add_ids(read_container, write_container, c_ids, level)
-
-                    e_ids: Set[int] = set()
-                    for c_id in c_ids:
-                        e_ids |= equipment_by_container.get(int(c_id), set())
-                    add_ids(read_equipment, write_equipment, e_ids, level)
+                    c_ids = containers_by_plc.get(rid, empty)
+                    e_ids = empty.union(*(equipment_by_container.get(c_id, empty) for c_id in c_ids))
+                    containers.update(c_ids)
+                    equipment.update(e_ids)
 
-                    dp_ids: Set[int] = set()
-                    dp_ids |= datapoints_by_owner.get(("plc", rid), set())
+                    datapoints.update(datapoints_by_owner.get(("plc", rid), empty))
                     for c_id in c_ids:
-                        dp_ids |= datapoints_by_owner.get(("container", int(c_id)), set())
+                        datapoints.update(datapoints_by_owner.get(("container", c_id), empty))
                     for e_id in e_ids:
-                        dp_ids |= datapoints_by_owner.get(("equipment", int(e_id)), set())
-                    add_ids(read_dp, write_dp, dp_ids, level)
+                        datapoints.update(datapoints_by_owner.get(("equipment", e_id), empty))
 
             elif rtype == "container":
-                add_ids(read_container, write_container, [rid], level)
+                containers.add(rid)
                 if include:
-                    e_ids = equipment_by_container.get(rid, set())
-                    add_ids(read_equipment, write_equipment, e_ids, level)
+                    e_ids = equipment_by_container.get(rid, empty)
+                    equipment.update(e_ids)
 
-                    dp_ids: Set[int] = set()
-                    dp_ids |= datapoints_by_owner.get(("container", rid), set())
+                    datapoints.update(datapoints_by_owner.get(("container", rid), empty))
                     for e_id in e_ids:
-                        dp_ids |= datapoints_by_owner.get(("equipment", int(e_id)), set())
-                    add_ids(read_dp, write_dp, dp_ids, level)
+                        datapoints.update(datapoints_by_owner.get(("equipment", e_id), empty))
 
             elif rtype == "equipment":
-                add_ids(read_equipment, write_equipment, [rid], level)
+                equipment.add(rid)
                 if include:
-                    dp_ids = datapoints_by_owner.get(("equipment", rid), set())
-                    add_ids(read_dp, write_dp, dp_ids, level)
+                    datapoints.update(datapoints_by_owner.get(("equipment", rid), empty))
 
             elif rtype == "datapoint":
-                add_ids(read_dp, write_dp, [rid], level)
+                datapoints.add(rid)
 
         # write implies read
         read_plc |= write_plc
@@ -280,53 +361,40 @@ class AccessControlService:
         read_equipment |= write_equipment
         read_dp |= write_dp
 
-        # Add ancestors for tree navigation (read-only escalation).
-        changed = True
-        while changed:
-            changed = False
-
-            # container -> plc
-            for c_id in list(read_container):
-                plc_id = container_to_plc.get(int(c_id))
-                if plc_id is not None and plc_id not in read_plc:
-                    read_plc.add(int(plc_id))
-                    changed = True
-
-            # equipment -> container
-            for e_id in list(read_equipment):
-                c_id = equipment_to_container.get(int(e_id))
-                if c_id is not None and c_id not in read_container:
-                    read_container.add(int(c_id))
-                    changed = True
-
-            # datapoint -> owner
-            for dp_id in list(read_dp):
-                owner = dp_to_owner.get(int(dp_id))
-                if not owner:
-                    continue
-                owner_type, owner_id = owner
-                if owner_type == "plc":
-                    if owner_id not in read_plc:
-                        read_plc.add(int(owner_id))
-                        changed = True
-                elif owner_type == "container":
-                    if owner_id not in read_container:
-                        read_container.add(int(owner_id))
-                        changed = True
-                elif owner_type == "equipment":
-                    if owner_id not in read_equipment:
-                        read_equipment.add(int(owner_id))
-                        changed = True
+        # Add ancestors for tree navigation (read-only escalation). The tree only points upwards
+        # (datapoint -> owner, equipment -> container, container -> plc), so one sweep per
+        # level, leaves first, reaches every ancestor.
+        for dp_id in read_dp:
+            owner = dp_to_owner.get(dp_id)
+            if not owner:
+                continue
+            owner_type, owner_id = owner
+            if owner_type == "plc":
+                read_plc.add(owner_id)
+            elif owner_type == "container":
+                read_container.add(owner_id)
+            elif owner_type == "equipment":
+                read_equipment.add(owner_id)
+
+        for e_id in read_equipment:
+            c_id = equipment_to_container.get(e_id)
+            if c_id is not None:
+                read_container.add(c_id)
+
+        for c_id in read_container:
+            plc_id = container_to_plc.get(c_id)
+            if plc_id is not None:
+                read_plc.add(plc_id)
 
         return EffectiveAccess(
-            read_plc_ids=read_plc,
-            write_plc_ids=write_plc,
-            read_container_ids=read_container,
-            write_container_ids=write_container,
-            read_equipment_ids=read_equipment,
-            write_equipment_ids=write_equipment,
-            read_datapoint_ids=read_dp,
-            write_datapoint_ids=write_dp,
+            read_plc_ids=frozenset(read_plc),
+            write_plc_ids=frozenset(write_plc),
+            read_container_ids=frozenset(read_container),
+            write_container_ids=frozenset(write_container),
+            read_equipment_ids=frozenset(read_equipment),
+            write_equipment_ids=frozenset(write_equipment),
+            read_datapoint_ids=frozenset(read_dp),
+            write_datapoint_ids=frozenset(write_dp),
         )
 
     def effective_access(self, db: Session, user: User) -> EffectiveAccess:
@@ -345,16 +413,17 @@ class AccessControlService:
 
         role_ids = [r.id for r in (user.roles or [])]
 
-        if role_ids:
+        def compute() -> EffectiveAccess:
+            # An empty IN list renders as an always-false predicate, so users without roles
+            # need no separate query.
             grants = (
                 db.query(CfgAccessGrant)
                 .filter(or_(CfgAccessGrant.user_id == user.id, CfgAccessGrant.role_id.in_(role_ids)))
                 .all()
             )
-        else:
-            grants = db.query(CfgAccessGrant).filter(CfgAccessGrant.user_id == user.id).all()
+            return self._effective_access_from_grants(db, grants)
 
-        return self._effective_access_from_grants(db, grants)
+        return self._cached_access(db, ("user", user.id, tuple(sorted(role_ids))), compute)
 
     def effective_access_for_role_ids(self, db: Session, *, role_ids: Iterable[int]) -> EffectiveAccess:
         """Compute effective access for a principal identified only by roles.
@@ -371,11 +440,13 @@ class AccessControlService:
             if ri > 0:
                 ids.append(ri)
 
-        if not ids:
-            return self._effective_access_from_grants(db, [])
+        def compute() -> EffectiveAccess:
+            if not ids:
+                return self._effective_access_from_grants(db, [])
+            grants = db.query(CfgAccessGrant).filter(CfgAccessGrant.role_id.in_(ids)).all()
+            return self._effective_access_from_grants(db, grants)
 
-        grants = db.query(CfgAccessGrant).filter(CfgAccessGrant.role_id.in_(ids)).all()
-        return self._effective_access_from_grants(db, grants)
+        return self._cached_access(db, ("roles", tuple(sorted(set(ids)))), compute)
 
     def can_read(self, db: Session, user: User, resource_type: str, resource_id: int) -> bool:
         ea = self.effective_access(db, user)
@@ -3,10 +3,15 @@ from __future__ import annotations
 import datetime as dt
 import hashlib
 import logging
-from typing import Any, Dict, Optional
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session, aliased
 
+from sunny_scada.db.config_version import CONFIG_CACHE_MAX_AGE_S, config_version, stored_config_version
 from sunny_scada.db.models import (
     AlarmEvent,
     AlarmOccurrence,
@@ -18,6 +23,12 @@ from sunny_scada.db.models import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached datapoint name lookups before the cache is reset.
+_NAMES_CACHE_MAX = 4096
+
+# meta keys that, when all set, fully determine an alarm's context names.
+_CONTEXT_META_KEYS = ("plc", "container", "equipment", "label")
+
 
 def _utcnow() -> dt.datetime:
     return dt.datetime.now(dt.timezone.utc)
@@ -25,76 +36,64 @@ def _utcnow() -> dt.datetime:
 
 def make_stable_key(*, source: str, raw: str) -> str:
     """Create a stable key for sources that don't provide a natural dedupe key."""
-    h = hashlib.sha1((source + "|" + raw).encode("utf-8")).hexdigest()
-    return h
+    return _stable_key(source, raw)
+
+
+@lru_cache(maxsize=4096)
+def _stable_key(source: str, raw: str) -> str:
+    # Stored occurrences are looked up by this digest, so the algorithm and input layout
+    # (source|raw) must stay as they are; the cache absorbs repeats from polling sources.
+    h = hashlib.sha1(source.encode("utf-8"))
+    h.update(b"|")
+    h.update(raw.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _datapoint_names(db: Session, datapoint_ids: Iterable[int]) -> Dict[int, Dict[str, Optional[str]]]:
+    """Resolve label and owning plc/container/equipment names for datapoints in one query."""
+    ids = {int(i) for i in datapoint_ids if i is not None}
+    if not ids:
+        return {}
+
+    dp = CfgDataPoint
+    owner_type = func.lower(func.trim(dp.owner_type))
+    eq = aliased(CfgEquipment)
+    ct = aliased(CfgContainer)
+    plc = aliased(CfgPLC)
+
+    rows = (
+        db.query(dp.id, dp.label, eq.name, ct.name, plc.name)
+        .outerjoin(eq, and_(owner_type == "equipment", eq.id == dp.owner_id))
+        .outerjoin(ct, or_(and_(owner_type == "container", ct.id == dp.owner_id), ct.id == eq.container_id))
+        .outerjoin(plc, or_(and_(owner_type == "plc", plc.id == dp.owner_id), plc.id == ct.plc_id))
+        .filter(dp.id.in_(ids))
+        .all()
+    )
+    return {
+        int(dp_id): {
+            "plc_name": plc_name,
+            "container_name": container_name,
+            "equipment_name": equipment_name,
+            "datapoint_label": label,
+        }
+        for dp_id, label, equipment_name, container_name, plc_name in rows
+    }
 
 
-def _alarm_context_for_datapoint(
-    db: Session,
-    *,
-    datapoint_id: Optional[int],
+def _alarm_context(
     meta: Optional[Dict[str, Any]],
+    names: Optional[Dict[str, Optional[str]]],
 ) -> Dict[str, Optional[str]]:
-    context: Dict[str, Optional[str]] = {
-        "plc_name": None,
-        "container_name": None,
-        "equipment_name": None,
-        "datapoint_label": None,
+    """Context names for an alarm payload: values from `meta` win over the datapoint's own."""
+    m = meta or {}
+    names = names or {}
+    return {
+        "plc_name": str(m["plc"]) if m.get("plc") else names.get("plc_name"),
+        "container_name": str(m["container"]) if m.get("container") else names.get("container_name"),
+        "equipment_name": str(m["equipment"]) if m.get("equipment") else names.get("equipment_name"),
+        "datapoint_label": str(m["label"]) if m.get("label") else names.get("datapoint_label"),
     }
 
-    m = dict(meta or {})
-    if m.get("plc"):
-        context["plc_name"] = str(m.get("plc"))
-    if m.get("container"):
-        context["container_name"] = str(m.get("container"))
-    if m.get("equipment"):
-        context["equipment_name"] = str(m.get("equipment"))
-    if m.get("label"):
-        context["datapoint_label"] = str(m.get("label"))
-
-    if datapoint_id is None:
-        return context
-
-    dp = db.query(CfgDataPoint).filter(CfgDataPoint.id == int(datapoint_id)).one_or_none()
-    if not dp:
-        return context
-
-    context["datapoint_label"] = context["datapoint_label"] or dp.label
-
-    owner_type = (dp.owner_type or "").strip().lower()
-    owner_id = int(dp.owner_id)
-
-    if owner_type == "plc":
-        plc = db.query(CfgPLC).filter(CfgPLC.id == owner_id).one_or_none()
-        if plc:
-            context["plc_name"] = context["plc_name"] or plc.name
-        return context
-
-    if owner_type == "container":
-        container = db.query(CfgContainer).filter(CfgContainer.id == owner_id).one_or_none()
-        if not container:
-            return context
-        context["container_name"] = context["container_name"] or container.name
-        plc = db.query(CfgPLC).filter(CfgPLC.id == int(container.plc_id)).one_or_none()
-        if plc:
-            context["plc_name"] = context["plc_name"] or plc.name
-        return context
-
-    if owner_type == "equipment":
-        equipment = db.query(CfgEquipment).filter(CfgEquipment.id == owner_id).one_or_none()
-        if not equipment:
-            return context
-        context["equipment_name"] = context["equipment_name"] or equipment.name
-
-        container = db.query(CfgContainer).filter(CfgContainer.id == int(equipment.container_id)).one_or_none()
-        if container:
-            context["container_name"] = context["container_name"] or container.name
-            plc = db.query(CfgPLC).filter(CfgPLC.id == int(container.plc_id)).one_or_none()
-            if plc:
-                context["plc_name"] = context["plc_name"] or plc.name
-
-    return context
-
 
 class AlarmManager:
     """Central alarm state manager.
@@ -103,8 +102,57 @@ class AlarmManager:
     - Inserts AlarmEvent only on state transition
     - Commits DB transaction
     - Optionally broadcasts only on transition
+    - Caches datapoint context names until the config tree changes in any worker
+      (config_version / stored_config_version) or CONFIG_CACHE_MAX_AGE_S passes
     """
 
+    def __init__(self) -> None:
+        self._names_lock = threading.Lock()
+        self._names_version: Tuple[int, int] = (-1, -1)
+        self._names_built_at = 0.0
+        self._names_cache: Dict[int, Optional[Dict[str, Optional[str]]]] = {}
+
+    def _names_for(self, db: Session, datapoint_ids: Iterable[Optional[int]]) -> Dict[int, Optional[Dict[str, Optional[str]]]]:
+        """Cached _datapoint_names; unknown datapoints map to None."""
+        ids = {int(i) for i in datapoint_ids if i is not None}
+        if not ids:
+            return {}
+        # Same rules as the access cache: in-process and database-wide counters, plus a max age.
+        version = (config_version(), stored_config_version(db))
+        now = time.monotonic()
+        with self._names_lock:
+            if self._names_version != version or now - self._names_built_at >= CONFIG_CACHE_MAX_AGE_S:
+                self._names_cache.clear()
+                self._names_version = version
+                self._names_built_at = now
+            found = {i: self._names_cache[i] for i in ids if i in self._names_cache}
+
+        missing = ids.difference(found)
+        if missing:
+            fetched = _datapoint_names(db, missing)
+            for i in missing:
+                found[i] = fetched.get(i)
+            with self._names_lock:
+                # Only keep results that were read under the still-current config version.
+                if self._names_version == version and version[0] == config_version():
+                    if len(self._names_cache) + len(missing) > _NAMES_CACHE_MAX:
+                        self._names_cache.clear()
+                    for i in missing:
+                        self._names_cache[i] = found[i]
+        return found
+
+    def datapoint_names(self, db: Session, datapoint_id: int) -> Dict[str, Optional[str]]:
+        """Label and plc/container/equipment names of a datapoint ({} if it does not exist)."""
+        return self._names_for(db, [datapoint_id]).get(int(datapoint_id)) or {}
+
+    def _context(self, db: Session, datapoint_id: Optional[int], meta: Optional[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+        names = None
+        m = meta or {}
+        # Senders that already supply every name (pollers) need no datapoint lookup.
+        if datapoint_id is not None and not all(m.get(k) for k in _CONTEXT_META_KEYS):
+            names = self._names_for(db, [datapoint_id]).get(int(datapoint_id))
+        return _alarm_context(meta, names)
+
     def set_state(
         self,
         db: Session,
@@ -143,6 +191,7 @@ class AlarmManager:
             occ = (
                 db.query(AlarmOccurrence)
                 .filter(AlarmOccurrence.source == src, AlarmOccurrence.key == k)
+                .with_for_update()
                 .one_or_none()
             )
 
@@ -172,7 +221,6 @@ class AlarmManager:
                     meta=meta,
                 )
                 db.add(occ)
-                db.flush()  # assign occ.id
 
             prev_state = (occ.state or "OK").upper()
 
@@ -213,6 +261,12 @@ class AlarmManager:
                     occ.acknowledged_by_user_id = None
                     occ.acknowledged_by_client_ip = None
 
+            if occ.id is None:
+                # New row: flush now, with its final field values, to get the id the event and
+                # payload reference. Flushing before the updates above would cost an extra UPDATE.
+                db.flush()
+
+            if transitioned:
                 evt = AlarmEvent(
                     occurrence_id=occ.id,
                     ts=ts,
@@ -230,6 +284,31 @@ class AlarmManager:
                 )
                 db.add(evt)
 
+            # Build the payload from the in-memory row before committing: after the commit the
+            # instance is expired and reading it would reload the row.
+            context = self._context(db, occ.datapoint_id, occ.meta)
+
+            payload = {
+                "type": "alarm_state",
+                "ts": ts.isoformat(),
+                "source": src,
+                "datapoint_id": occ.datapoint_id,
+                "datapoint_label": context.get("datapoint_label"),
+                "plc_name": context.get("plc_name"),
+                "container_name": context.get("container_name"),
+                "equipment_name": context.get("equipment_name"),
+                "rule_id": occ.rule_id,
+                "external_rule_id": occ.external_rule_id,
+                "occurrence_id": occ.id,
+                "key": occ.key,
+                "state": occ.state,
+                "severity": occ.severity,
+                "value": occ.value,
+                "warning_threshold": occ.warning_threshold,
+                "alarm_threshold": occ.alarm_threshold,
+                "message": (message or occ.message or ""),
+            }
+
             db.add(occ)
             db.commit()
 
@@ -238,33 +317,6 @@ class AlarmManager:
             logger.exception("AlarmManager.set_state failed (rolled back). source=%s key=%s", src, k)
             raise
 
-        context = _alarm_context_for_datapoint(
-            db,
-            datapoint_id=occ.datapoint_id,
-            meta=(occ.meta or {}),
-        )
-
-        payload = {
-            "type": "alarm_state",
-            "ts": ts.isoformat(),
-            "source": src,
-            "datapoint_id": occ.datapoint_id,
-            "datapoint_label": context.get("datapoint_label"),
-            "plc_name": context.get("plc_name"),
-            "container_name": context.get("container_name"),
-            "equipment_name": context.get("equipment_name"),
-            "rule_id": occ.rule_id,
-            "external_rule_id": occ.external_rule_id,
-            "occurrence_id": occ.id,
-            "key": occ.key,
-            "state": occ.state,
-            "severity": occ.severity,
-            "value": occ.value,
-            "warning_threshold": occ.warning_threshold,
-            "alarm_threshold": occ.alarm_threshold,
-            "message": (message or occ.message or ""),
-        }
-
         if transitioned and broadcast_cb:
             try:
                 broadcast_cb(payload)
@@ -274,8 +326,8 @@ class AlarmManager:
         return {
             "created": created,
             "transitioned": transitioned,
-            "occurrence_id": occ.id,
-            "state": occ.state,
+            "occurrence_id": payload["occurrence_id"],
+            "state": payload["state"],
             "payload": payload,
         }
 
@@ -321,13 +373,12 @@ class AlarmManager:
             .all()
         )
 
+        names_by_dp = self._names_for(db, (r.datapoint_id for r in rows))
+
         out = []
         for r in rows:
-            context = _alarm_context_for_datapoint(
-                db,
-                datapoint_id=r.datapoint_id,
-                meta=(r.meta or {}),
-            )
+            names = names_by_dp.get(r.datapoint_id) if r.datapoint_id is not None else None
+            context = _alarm_context(r.meta, names)
             out.append(
                 {
                     "occurrence_id": r.id,
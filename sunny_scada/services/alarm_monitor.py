@@ -7,7 +7,7 @@ from typing import Any, Dict, Iterator, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
-from sunny_scada.db.models import AlarmRule, CfgContainer, CfgDataPoint, CfgEquipment
+from sunny_scada.db.models import AlarmRule
 from sunny_scada.services.alarm_manager import AlarmManager
 from sunny_scada.services.datapoint_identity import (
     AmbiguousDatapointIdentifierError,
@@ -386,25 +386,10 @@ class AlarmMonitor:
         evaluated_state: str,
         message: str,
     ) -> None:
-        container_name: Optional[str] = None
-        equipment_name: Optional[str] = None
-
-        dp = db.query(CfgDataPoint).filter(CfgDataPoint.id == int(datapoint_id)).one_or_none()
-        if dp:
-            owner_type = (dp.owner_type or "").strip().lower()
-            owner_id = int(dp.owner_id)
-
-            if owner_type == "container":
-                container = db.query(CfgContainer).filter(CfgContainer.id == owner_id).one_or_none()
-                if container:
-                    container_name = container.name
-            elif owner_type == "equipment":
-                equipment = db.query(CfgEquipment).filter(CfgEquipment.id == owner_id).one_or_none()
-                if equipment:
-                    equipment_name = equipment.name
-                    container = db.query(CfgContainer).filter(CfgContainer.id == int(equipment.container_id)).one_or_none()
-                    if container:
-                        container_name = container.name
+        # Names come from the AlarmManager's cache, so steady polling does not re-read the tree.
+        names = self._am.datapoint_names(db, datapoint_id)
+        container_name: Optional[str] = names.get("container_name")
+        equipment_name: Optional[str] = names.get("equipment_name")
 
         src = "frontend_rule" if (rule.rule_source or "backend") == "frontend" else "backend_rule"
         key = f"{src}:{rule.external_rule_id or rule.id}"
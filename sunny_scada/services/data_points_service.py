@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from threading import RLock
 from typing import Any, Dict, Optional
 
 import yaml
 
+from sunny_scada.yaml_cache import clear_yaml_cache, load_yaml
+
 
 class DataPointsService:
     """Thread-safe YAML read/update/add + register lookup."""
@@ -13,18 +16,22 @@ class DataPointsService:
     def __init__(self, yaml_path: str):
         self.path = Path(yaml_path)
         self._lock = RLock()
+        # Per-direction register-name index, valid for the document object it was built from.
+        self._index_doc: Any = None
+        self._index: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
     def _read_all(self) -> Dict[str, Any]:
+        """Parsed YAML, cached until the file changes. Shared: deep-copy before mutating."""
         with self._lock:
             if not self.path.exists():
                 return {}
-            with self.path.open("r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+            return load_yaml(str(self.path)) or {}
 
     def _write_all(self, data: Dict[str, Any]) -> None:
         with self._lock:
             with self.path.open("w", encoding="utf-8") as f:
                 yaml.safe_dump(data, f, sort_keys=False, default_flow_style=False)
+            clear_yaml_cache()
 
     def get_by_path(self, path: str) -> Optional[Any]:
         """Get any node by slash-separated path. Example: 'data_points/plcs/comp/screw/comp_1/read'."""
@@ -42,7 +49,7 @@ class DataPointsService:
 
     def update_point_at_path(self, path: str, point_data: Dict[str, Any]) -> bool:
         """Update an existing leaf key at full path (path includes the key)."""
-        data = self._read_all()
+        data = copy.deepcopy(self._read_all())
         keys = [k for k in (path or "").split("/") if k]
         if not keys:
             return False
@@ -62,7 +69,7 @@ class DataPointsService:
 
     def add_point(self, parent_path: str, name: str, point_data: Dict[str, Any]) -> bool:
         """Add a new key under parent_path."""
-        data = self._read_all()
+        data = copy.deepcopy(self._read_all())
         keys = [k for k in (parent_path or "").split("/") if k]
         parent = data
         for k in keys:
@@ -80,25 +87,35 @@ class DataPointsService:
 
     def find_register(self, register_name: str, direction: str = "read") -> Optional[Dict[str, Any]]:
         """Find first occurrence of register_name under any `{direction: {...}}` block."""
-        root = (self._read_all().get("data_points") or {})
-        return _find_in_tree(root, register_name, direction)
-
-
-def _find_in_tree(node: Any, register_name: str, direction: str) -> Optional[Dict[str, Any]]:
-    if isinstance(node, dict):
-        block = node.get(direction)
-        if isinstance(block, dict) and register_name in block and isinstance(block[register_name], dict):
-            return block[register_name]
-
-        for v in node.values():
-            found = _find_in_tree(v, register_name, direction)
-            if found is not None:
-                return found
-
-    if isinstance(node, list):
-        for item in node:
-            found = _find_in_tree(item, register_name, direction)
-            if found is not None:
-                return found
-
-    return None
+        with self._lock:
+            data = self._read_all()
+            if data is not self._index_doc:
+                self._index_doc = data
+                self._index = {}
+            index = self._index.get(direction)
+            if index is None:
+                index = {}
+                _index_tree(data.get("data_points") or {}, direction, index)
+                self._index[direction] = index
+            return index.get(register_name)
+
+
+def _index_tree(root: Any, direction: str, index: Dict[str, Dict[str, Any]]) -> None:
+    """Map each register name to its first `{direction: {...}}` entry in depth-first order."""
+    # Explicit stack instead of recursion; children are pushed reversed so nodes are still
+    # visited in document order and the first occurrence of a name wins.
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            block = node.get(direction)
+            if isinstance(block, dict):
+                for name, point in block.items():
+                    if isinstance(point, dict):
+                        index.setdefault(name, point)
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            continue
+        stack.extend(child for child in reversed(children) if isinstance(child, (dict, list)))
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from sunny_scada.plc_reader import PLCReader
 from sunny_scada.services.datapoint_identity import make_canonical_datapoint_key
@@ -59,6 +59,23 @@ class PollingService:
                 return
             time.sleep(0.1)
 
+    def _read_plcs(self, requests: Dict[str, Dict[Any, Dict[str, Any]]]) -> Dict[str, Dict[Any, Dict[str, Any]]]:
+        """Read each PLC's points, overlapping PLCs on the reader's pool (PLC_READ_WORKERS).
+
+        A PLC whose read raises is logged and left out, so one unreachable device does not
+        drop the rest of the tick.
+        """
+
+        def read_one(plc_name: str) -> Dict[Any, Dict[str, Any]]:
+            try:
+                return self._reader.read_data_points(plc_name, requests[plc_name])
+            except Exception as e:
+                logger.warning("Polling PLC '%s' failed: %s", plc_name, e)
+                return {}
+
+        names = list(requests)
+        return dict(zip(names, self._reader.map_plcs(read_one, names)))
+
     def _run(self) -> None:
         logger.debug("PollingService._run() thread started")
         logger.info("PollingService polling loop started.")
@@ -123,19 +140,30 @@ class PollingService:
                         if plc_name:
                             points_by_plc.setdefault(plc_name, []).append(dp)
 
-                for plc_name, points in points_by_plc.items():
-                    # Batch poll all addresses for this PLC
-                    batch_results = {}
-                    storage_results = {}  # Separate format for DataStorage
-                    for dp in points:
-                        canonical_key = make_canonical_datapoint_key(int(dp.id))
-                        point_details = {
+                # Batch poll all addresses per PLC: adjacent registers are coalesced into block
+                # reads instead of one Modbus round-trip per data point. Only plain dicts cross
+                # into the worker threads; ORM rows stay on this thread with the session.
+                requests = {
+                    plc_name: {
+                        dp.id: {
                             "address": dp.address,
                             "type": dp.type,
                             "description": dp.description,
                             "label": dp.label,
                         }
-                        result = self._reader.read_data_point(plc_name, dp.label, point_details)
+                        for dp in points
+                    }
+                    for plc_name, points in points_by_plc.items()
+                }
+                results_by_plc = self._read_plcs(requests)
+
+                for plc_name, points in points_by_plc.items():
+                    batch_results = {}
+                    storage_results = {}  # Separate format for DataStorage
+                    results = results_by_plc.get(plc_name) or {}
+                    for dp in points:
+                        canonical_key = make_canonical_datapoint_key(int(dp.id))
+                        result = results.get(dp.id)
                         if result is not None:
                             # Use the same structure as DB
                             batch_results[canonical_key] = {
@@ -172,7 +200,8 @@ class PollingService:
                 session.close()
 
                 logger.debug("Polled DB datapoints data_type=%s", type(db_data))
-                logger.debug("Polling snapshot sample=%s", str(db_data)[:800])
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Polling snapshot sample=%s", str(db_data)[:800])
 
                 if self._alarm_monitor and db_data:
                     logger.debug("Polling calling AlarmMonitor.process_plc_snapshot")
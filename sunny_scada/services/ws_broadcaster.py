@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+# A client that cannot take a message within this many seconds is dropped, so one stalled
+# socket cannot hold up delivery to everyone else.
+SEND_TIMEOUT_S = 1.0
+
+
+@dataclass(frozen=True)
+class Connection:
+    websocket: WebSocket
+    principal_key: str
+
+
+class WebSocketBroadcaster:
+    """Thread-safe in-process WebSocket broadcaster.
+
+    Polling threads are not running in the asyncio event loop. We therefore
+    schedule sends via call_soon_threadsafe on the loop captured at startup.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        # Keyed by id(websocket): O(1) add/remove; each entry keeps its socket alive, so ids
+        # cannot be reused while registered.
+        self._conns: Dict[int, Connection] = {}
+        self._lock = asyncio.Lock()
+
+    async def add(self, websocket: WebSocket, *, principal_key: str) -> None:
+        async with self._lock:
+            self._conns[id(websocket)] = Connection(websocket=websocket, principal_key=principal_key)
+
+    async def remove(self, websocket: WebSocket) -> None:
+        async with self._lock:
+            self._conns.pop(id(websocket), None)
+
+    def _before_send(self, payload: Dict[str, Any], n_conns: int) -> None:
+        """Hook for subclasses, called on the event loop before each fan-out."""
+
+    def broadcast(self, payload: Dict[str, Any]) -> None:
+        """Broadcast a JSON message to all connected clients."""
+
+        async def _send_all() -> None:
+            async with self._lock:
+                conns = list(self._conns.values())
+
+            self._before_send(payload, len(conns))
+            # Encode once (same format as WebSocket.send_json) and send to all clients concurrently.
+            try:
+                text = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+            except (TypeError, ValueError):
+                logger.exception("%s payload is not JSON serializable (dropped).", type(self).__name__)
+                return
+            results = await asyncio.gather(
+                *(asyncio.wait_for(c.websocket.send_text(text), timeout=SEND_TIMEOUT_S) for c in conns),
+                return_exceptions=True,
+            )
+            dead: list[Connection] = []
+            for c, res in zip(conns, results):
+                if isinstance(res, asyncio.TimeoutError):
+                    logger.warning(
+                        "%s: client %s did not take a message within %.1fs; disconnecting.",
+                        type(self).__name__,
+                        c.principal_key,
+                        SEND_TIMEOUT_S,
+                    )
+                    dead.append(c)
+                elif isinstance(res, BaseException):
+                    dead.append(c)
+
+            if dead:
+                async with self._lock:
+                    for d in dead:
+                        if self._conns.get(id(d.websocket)) is d:
+                            del self._conns[id(d.websocket)]
+                # Close dropped sockets so their clients see the disconnect and reconnect; a send
+                # cancelled by the timeout may also have left a partial frame on the stream.
+                # Closing a stalled socket can block too, so bound it the same way.
+                await asyncio.gather(
+                    *(asyncio.wait_for(d.websocket.close(code=1011), timeout=SEND_TIMEOUT_S) for d in dead),
+                    return_exceptions=True,
+                )
+
+        try:
+            self._loop.call_soon_threadsafe(lambda: asyncio.create_task(_send_all()))
+        except Exception as e:
+            logger.debug("%s scheduling failed: %s", type(self).__name__, e)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from typing import Any, Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# The libyaml-backed loader is several times faster than the pure-Python one; it is only
+# present when PyYAML was built against libyaml.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def cache_dir() -> Optional[str]:
+    """Directory for on-disk parse caches (YAML_CACHE_DIR); unset disables them."""
+    return os.getenv("YAML_CACHE_DIR") or None
+
+
+def _sidecar_prefix(directory: str, path: str) -> str:
+    # Name sidecars after the source file plus a digest of its full path, so two
+    # data_points.yaml files in different folders never share entries.
+    tag = hashlib.blake2b(path.encode("utf-8"), digest_size=6).hexdigest()
+    return os.path.join(directory, f"{os.path.basename(path)}.{tag}")
+
+
+def _json_safe(doc: Any) -> bool:
+    """True when `doc` survives a JSON round-trip unchanged (str keys, no dates, ...)."""
+    try:
+        return json.loads(json.dumps(doc)) == doc
+    except (TypeError, ValueError):
+        return False
+
+
+def _load_with_sidecar(path: str, directory: str) -> Any:
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.blake2b(raw, digest_size=8).hexdigest()
+    prefix = _sidecar_prefix(directory, path)
+    sidecar = f"{prefix}.{digest}.json"
+
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable YAML cache '%s': %s", sidecar, e)
+
+    doc = yaml.load(raw.decode("utf-8"), Loader=SafeLoader)
+    if not _json_safe(doc):
+        return doc
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(doc, f, separators=(",", ":"))
+        os.replace(tmp, sidecar)
+        for stale in glob.glob(glob.escape(prefix) + ".*.json"):
+            if stale != sidecar:
+                os.remove(stale)
+    except OSError as e:
+        logger.warning("Could not write YAML cache for '%s': %s", path, e)
+    return doc
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int, ino: int) -> Any:
+    directory = cache_dir()
+    if directory:
+        return _load_with_sidecar(path, directory)
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_yaml(path: str) -> Any:
+    """Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    Entries are keyed on (absolute path, mtime_ns, size, inode), so editing the file - or
+    atomically replacing it - invalidates the cached document. The returned object is shared
+    between callers and must be treated as read-only; copy it before mutating.
+
+    When YAML_CACHE_DIR is set, the parsed document is also written there as JSON named by
+    a content hash, so a cold start can skip the YAML parse entirely. Documents that JSON
+    cannot represent exactly (non-string keys, timestamps) are never written.
+    """
+    abspath = os.path.abspath(path)
+    st = os.stat(abspath)
+    return _load_yaml_cached(abspath, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all in-memory parses (call after rewriting a file in place)."""
+    _load_yaml_cached.cache_clear()
@@ -0,0 +1,73 @@
+import unittest
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from sunny_scada.db.base import Base
+from sunny_scada.db.models import CfgContainer, CfgPLC
+from sunny_scada.services.access_control_service import AccessControlService
+
+
+class AccessControlCacheTests(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+        self.engine = engine
+        self.db = sessionmaker(bind=engine)()
+        self.addCleanup(self.db.close)
+        self.ac = AccessControlService()
+        self.user = SimpleNamespace(id=1, roles=[])
+
+        plc = CfgPLC(name="plc1", ip="127.0.0.1", port=502)
+        self.db.add(plc)
+        self.db.commit()
+        self.plc_id = plc.id
+
+    def test_cached_until_tree_or_grants_change(self):
+        self.ac.upsert_grant(self.db, user_id=1, resource_type="plc", resource_id=self.plc_id, access_level="read")
+        first = self.ac.effective_access(self.db, self.user)
+        self.assertIs(self.ac.effective_access(self.db, self.user), first)
+        self.assertEqual(first.read_container_ids, set())
+
+        c = CfgContainer(plc_id=self.plc_id, name="c1", type="room")
+        self.db.add(c)
+        self.db.commit()
+        self.assertTrue(self.ac.can_read(self.db, self.user, "container", c.id))
+
+        self.ac.clear_user_grants(self.db, user_id=1)
+        self.assertFalse(self.ac.can_read(self.db, self.user, "plc", self.plc_id))
+
+    def test_sees_changes_committed_by_other_workers(self):
+        first = self.ac.effective_access(self.db, self.user)
+        self.assertFalse(first.can_read("plc", self.plc_id))
+        with self.assertRaises(AttributeError):
+            first.read_plc_ids.add(self.plc_id)
+
+        # Another process: plain SQL, so none of this process's session events fire.
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO cfg_access_grants (user_id, resource_type, resource_id, access_level,"
+                    " include_descendants, created_at, updated_at)"
+                    " VALUES (1, 'plc', :plc, 'read', 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ),
+                {"plc": self.plc_id},
+            )
+            conn.execute(text("UPDATE cfg_version SET version = version + 1 WHERE id = 1"))
+        self.db.commit()
+
+        self.assertTrue(self.ac.can_read(self.db, self.user, "plc", self.plc_id))
+
+    def test_tree_shared_between_principals(self):
+        tree = self.ac._config_tree(self.db)
+        self.ac.effective_access_for_role_ids(self.db, role_ids=[1])
+        self.assertIs(self.ac._config_tree(self.db), tree)
+
+        self.db.add(CfgContainer(plc_id=self.plc_id, name="c1", type="room"))
+        self.db.commit()
+        self.assertEqual(self.ac._config_tree(self.db).containers_by_plc, {self.plc_id: {1}})
+
+
+if __name__ == "__main__":
+    unittest.main()
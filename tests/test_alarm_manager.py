@@ -1,11 +1,11 @@
 import datetime as dt
 import unittest
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from sunny_scada.db.base import Base
-from sunny_scada.db.models import AlarmEvent, AlarmOccurrence
+from sunny_scada.db.models import AlarmEvent, AlarmOccurrence, CfgContainer, CfgDataPoint, CfgPLC
 from sunny_scada.services.alarm_manager import AlarmManager
 
 
@@ -59,6 +59,33 @@ class AlarmManagerTests(unittest.TestCase):
             # one event from OK->WARNING
             self.assertEqual(db.query(AlarmEvent).count(), 1)
 
+    def test_repeated_state_updates_in_place(self):
+        t0 = dt.datetime(2026, 2, 19, tzinfo=dt.timezone.utc)
+        with self.SessionLocal() as db:
+            r1 = self.am.set_state(
+                db, source="plc", key="plc:p", new_state="ALARM", severity="critical", message="boom", ts=t0,
+                value=1.0, meta={"plc": "plc1"},
+            )
+            loaded = db.get(AlarmOccurrence, r1["occurrence_id"])
+
+            r2 = self.am.set_state(
+                db, source="plc", key="plc:p", new_state="ALARM", severity="critical", message="boom",
+                ts=t0 + dt.timedelta(seconds=1), value=2.0, meta={"label": "P1"},
+            )
+            self.assertEqual((r2["transitioned"], r2["occurrence_id"]), (False, r1["occurrence_id"]))
+            self.assertEqual(
+                (r2["payload"]["state"], r2["payload"]["value"], r2["payload"]["plc_name"], r2["payload"]["datapoint_label"]),
+                ("ALARM", 2.0, "plc1", "P1"),
+            )
+            # The instance already held by the session sees the update.
+            self.assertEqual((loaded.value, loaded.meta), (2.0, {"plc": "plc1", "label": "P1"}))
+
+        with self.SessionLocal() as db:
+            occ = db.get(AlarmOccurrence, r1["occurrence_id"])
+            self.assertEqual(occ.last_seen_at.replace(tzinfo=dt.timezone.utc), t0 + dt.timedelta(seconds=1))
+            self.assertEqual(occ.meta, {"plc": "plc1", "label": "P1"})
+            self.assertEqual(db.query(AlarmEvent).count(), 1)
+
     def test_acknowledge(self):
         with self.SessionLocal() as db:
             r = self.am.set_state(
@@ -84,6 +111,54 @@ class AlarmManagerTests(unittest.TestCase):
             self.assertTrue(occ.acknowledged)
             self.assertIn("ack_note", occ.meta)
 
+    def test_snapshot_context_follows_config_changes(self):
+        with self.SessionLocal() as db:
+            plc = CfgPLC(name="plc1", ip="127.0.0.1", port=502)
+            db.add(plc)
+            db.flush()
+            container = CfgContainer(plc_id=plc.id, name="room1", type="room")
+            db.add(container)
+            db.flush()
+            dp = CfgDataPoint(
+                owner_type="container", owner_id=container.id, label="TEMP", category="read", type="REAL", address="40001"
+            )
+            db.add(dp)
+            db.commit()
+            dp_id = dp.id
+
+            self.am.set_state(
+                db, source="plc", key="plc:temp", new_state="ALARM", severity="critical", message="hot", datapoint_id=dp_id
+            )
+            snap = self.am.active_snapshot(db)
+            self.assertEqual(
+                (snap[0]["datapoint_label"], snap[0]["container_name"], snap[0]["plc_name"]), ("TEMP", "room1", "plc1")
+            )
+
+            db.get(CfgPLC, plc.id).name = "plc1-renamed"
+            db.commit()
+            self.assertEqual(self.am.active_snapshot(db)[0]["plc_name"], "plc1-renamed")
+
+    def test_snapshot_context_follows_changes_from_other_workers(self):
+        with self.SessionLocal() as db:
+            plc = CfgPLC(name="plc1", ip="127.0.0.1", port=502)
+            db.add(plc)
+            db.flush()
+            dp = CfgDataPoint(owner_type="plc", owner_id=plc.id, label="TEMP", category="read", type="REAL", address="40001")
+            db.add(dp)
+            db.commit()
+
+            self.am.set_state(
+                db, source="plc", key="plc:temp", new_state="ALARM", severity="critical", message="hot", datapoint_id=dp.id
+            )
+            self.assertEqual(self.am.active_snapshot(db)[0]["plc_name"], "plc1")
+
+            # Another process renames the PLC: plain SQL, so no session events fire here.
+            with self.engine.begin() as conn:
+                conn.execute(text("UPDATE cfg_plcs SET name = 'plc1-renamed'"))
+                conn.execute(text("UPDATE cfg_version SET version = version + 1 WHERE id = 1"))
+            db.commit()
+            self.assertEqual(self.am.active_snapshot(db)[0]["plc_name"], "plc1-renamed")
+
 
 if __name__ == "__main__":
     unittest.main()
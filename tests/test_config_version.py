@@ -0,0 +1,48 @@
+import unittest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from sunny_scada.db.base import Base
+from sunny_scada.db.config_version import stored_config_version
+from sunny_scada.db.models import CfgPLC
+
+
+class StoredConfigVersionTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.addCleanup(self.db.close)
+
+    def _rows(self):
+        with self.engine.connect() as conn:
+            return conn.execute(text("SELECT id, version FROM cfg_version")).all()
+
+    def test_create_all_seeds_the_row(self):
+        self.assertEqual(self._rows(), [(1, 0)])
+
+    def test_bumped_once_per_transaction(self):
+        self.db.add(CfgPLC(name="plc1", ip="127.0.0.1", port=502))
+        self.db.flush()
+        self.db.add(CfgPLC(name="plc2", ip="127.0.0.2", port=502))
+        self.db.commit()
+        self.assertEqual(stored_config_version(self.db), 1)
+
+        self.db.query(CfgPLC).filter(CfgPLC.name == "plc2").delete()
+        self.db.commit()
+        self.assertEqual(self._rows(), [(1, 2)])
+
+    def test_missing_row_is_upserted(self):
+        # Tables created before the row was seeded.
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM cfg_version"))
+
+        for i, name in enumerate(("plc1", "plc2"), start=1):
+            self.db.add(CfgPLC(name=name, ip="127.0.0.1", port=502))
+            self.db.commit()
+            self.assertEqual(self._rows(), [(1, i)])
+
+
+if __name__ == "__main__":
+    unittest.main()
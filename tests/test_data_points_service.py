@@ -0,0 +1,31 @@
+import os
+import tempfile
+import unittest
+
+from sunny_scada.services.data_points_service import DataPointsService
+
+
+class DataPointsServiceTests(unittest.TestCase):
+    def test_find_register_first_match_and_refresh_after_write(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data_points.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(
+                    "data_points:\n"
+                    "  a:\n"
+                    "    read: {START: {address: 40001}, BAD: 3}\n"
+                    "  b:\n"
+                    "    - read: {START: {address: 40100}, BAD: {address: 40200}}\n"
+                )
+            svc = DataPointsService(path)
+
+            self.assertEqual(svc.find_register("START")["address"], 40001)
+            self.assertEqual(svc.find_register("BAD")["address"], 40200)
+            self.assertIsNone(svc.find_register("START", direction="write"))
+
+            self.assertTrue(svc.add_point("data_points/c/write", "START", {"address": 40300}))
+            self.assertEqual(svc.find_register("START", direction="write")["address"], 40300)
+
+
+if __name__ == "__main__":
+    unittest.main()
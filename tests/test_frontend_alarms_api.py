@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def test_alarm_events_returns_payload_with_and_without_transition(client: TestClient, admin_token: str):
+    h = {"Authorization": f"Bearer {admin_token}"}
+    body = {"external_rule_id": "r1", "state": "ALARM", "severity": "critical", "value": 1.5, "meta": {"label": "T1"}}
+
+    r1 = client.post("/api/frontend/alarm-events", json=body, headers=h)
+    assert r1.status_code == 200, r1.text
+    first = r1.json()
+    assert (first["status"], first["created"], first["transitioned"], first["state"]) == ("ok", True, True, "ALARM")
+
+    r2 = client.post("/api/frontend/alarm-events", json={**body, "value": 2.5}, headers=h)
+    assert r2.status_code == 200, r2.text
+    again = r2.json()
+    assert set(again) == {"status", "created", "transitioned", "occurrence_id", "state", "payload"}
+    assert (again["created"], again["transitioned"]) == (False, False)
+
+    payload = again["payload"]
+    assert payload["occurrence_id"] == first["occurrence_id"] == again["occurrence_id"]
+    assert (payload["type"], payload["state"], payload["value"]) == ("alarm_state", "ALARM", 2.5)
+    assert (payload["external_rule_id"], payload["datapoint_label"]) == ("r1", "T1")
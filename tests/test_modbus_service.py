@@ -0,0 +1,111 @@
+import unittest
+from types import SimpleNamespace
+
+from sunny_scada.modbus_service import ModbusService, PLCConfig
+from sunny_scada.plc_writer import PLCWriter
+
+
+class _FakeClient:
+    """Stands in for ModbusTcpClient: one register bank, recorded requests, scripted replies."""
+
+    def __init__(self) -> None:
+        self.registers: dict[int, int] = {}
+        self.requests: list[tuple] = []
+        self.fail_reads = False
+        self.echo = None  # overrides the (address, value) echoed by write_register
+        self.no_write_reply = False
+
+    def is_socket_open(self) -> bool:
+        return True
+
+    def connect(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+    def read_holding_registers(self, address, count, slave=1):
+        self.requests.append(("read", address, count))
+        if self.fail_reads:
+            return None
+        regs = [self.registers.get(address + i, 0) for i in range(count)]
+        return SimpleNamespace(registers=regs, isError=lambda: False)
+
+    def write_register(self, address, value, slave=1):
+        self.requests.append(("write", address, value))
+        self.registers[address] = value
+        if self.no_write_reply:
+            return None
+        addr, val = self.echo if self.echo is not None else (address, value)
+        return SimpleNamespace(address=addr, value=val, isError=lambda: False)
+
+
+class ModbusServiceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.svc = ModbusService([PLCConfig(name="plc1", ip="127.0.0.1")], retries=0)
+        self.client = _FakeClient()
+        self.svc._clients["plc1"] = self.client
+
+
+class WriteRegisterVerifyTests(ModbusServiceTestCase):
+    def test_matching_echo_verifies_without_reading_back(self):
+        self.assertTrue(self.svc.write_register("plc1", 5, 1234, verify=True))
+        self.assertEqual(self.client.requests, [("write", 5, 1234)])
+
+    def test_mismatched_echo_fails_with_warning(self):
+        for echo in ((6, 1234), (5, 4321)):
+            self.client.echo = echo
+            with self.assertLogs("sunny_scada.modbus_service", level="WARNING"):
+                self.assertFalse(self.svc.write_register("plc1", 5, 1234, verify=True))
+
+    def test_echo_ignored_without_verify(self):
+        self.client.echo = (6, 0)
+        self.assertTrue(self.svc.write_register("plc1", 5, 1234))
+
+    def test_missing_response_fails(self):
+        self.client.no_write_reply = True
+        self.assertFalse(self.svc.write_register("plc1", 5, 1234, verify=True))
+
+    def test_plc_writer_verify_uses_the_echo(self):
+        writer = PLCWriter(self.svc)
+        self.assertTrue(writer.write_register("plc1", 40006, 7, verify=True))
+        self.assertEqual(self.client.requests, [("write", 6, 7)])
+
+
+class WriteBitsInHoldingRegisterTests(ModbusServiceTestCase):
+    def test_sets_and_clears_in_one_read_modify_write(self):
+        self.client.registers[10] = 0b1010_0101
+        self.assertTrue(self.svc.write_bits_in_holding_register("plc1", 10, 0b0000_1010, 0b0000_0101))
+        self.assertEqual(self.client.registers[10], 0b1010_1010)
+        self.assertEqual(self.client.requests, [("read", 10, 1), ("write", 10, 0b1010_1010)])
+
+    def test_rejects_out_of_range_and_overlapping_masks(self):
+        for set_mask, clear_mask in ((0x10000, 0), (0, -1), (0b11, 0b10)):
+            with self.assertRaises(ValueError):
+                self.svc.write_bits_in_holding_register("plc1", 10, set_mask, clear_mask)
+        self.assertEqual(self.client.requests, [])
+
+    def test_failed_read_skips_the_write(self):
+        self.client.fail_reads = True
+        self.assertFalse(self.svc.write_bits_in_holding_register("plc1", 10, 1, 0))
+        self.assertEqual(self.client.requests, [("read", 10, 1)])
+
+    def test_echo_mismatch_returns_false(self):
+        self.client.echo = (10, 0)
+        with self.assertLogs("sunny_scada.modbus_service", level="WARNING"):
+            self.assertFalse(self.svc.write_bits_in_holding_register("plc1", 10, 1, 0))
+
+    def test_single_bit_write_delegates(self):
+        self.client.registers[10] = 0b1000
+        self.assertTrue(self.svc.write_bit_in_holding_register("plc1", 10, 0, 1))
+        self.assertTrue(self.svc.write_bit_in_holding_register("plc1", 10, 3, 0))
+        self.assertEqual(self.client.registers[10], 0b0001)
+
+    def test_plc_writer_batch_converts_4x_address(self):
+        writer = PLCWriter(self.svc)
+        self.assertTrue(writer.bit_write_signals_batch("plc1", 40011, 0b0110, 0))
+        self.assertEqual(self.client.requests, [("read", 11, 1), ("write", 11, 0b0110)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import struct
+import threading
+import unittest
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from sunny_scada import plc_reader
+from sunny_scada.plc_reader import PLCReader
+
+
+class _FakeModbus:
+    """Just enough of ModbusService for PLCReader: a register bank and a request log."""
+
+    def __init__(self) -> None:
+        self.registers: dict[int, int] = {}
+        self.requests: list[tuple[int, int]] = []
+        self.failing: set[int] = set()  # block starts that return no response
+        self.short: set[int] = set()  # block starts that return one register too few
+        self._lock = threading.RLock()
+
+    def register_plcs(self, plcs) -> None:
+        pass
+
+    @contextmanager
+    def plc_lock(self, plc_name):
+        with self._lock:
+            yield
+
+    def read_holding_registers(self, plc_name, address, count, *, unit_id=None):
+        self.requests.append((address, count))
+        if address in self.failing:
+            return None
+        if address in self.short:
+            count -= 1
+        return [self.registers.get(address + i, 0) for i in range(count)]
+
+
+class ReadDataPointsTests(unittest.TestCase):
+    def setUp(self):
+        tmp = TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cfg = Path(tmp.name) / "config.yaml"
+        cfg.write_text("plcs:\n  - name: plc1\n    ip: 127.0.0.1\n", encoding="utf-8")
+        points = Path(tmp.name) / "data_points.yaml"
+        points.write_text("data_points: {}\n", encoding="utf-8")
+
+        self.modbus = _FakeModbus()
+        self.reader = PLCReader(self.modbus, config_file=str(cfg), points_file=str(points))
+        self.addCleanup(self.reader.close)
+
+        # 40011 INTEGER, 40012 REAL (read from 13..14), 40014 DIGITAL -> one block (11, 4);
+        # 40020 INTEGER -> its own block (20, 1).
+        hi, lo = struct.unpack(">HH", struct.pack(">f", 12.5))
+        self.modbus.registers.update({11: 7, 13: hi, 14: lo, 20: 99})
+        self.points = {
+            "count": {"address": 40011, "type": "INTEGER"},
+            "temp": {"address": 40012, "type": "REAL"},
+            "flags": {"address": 40014, "type": "DIGITAL", "bits": {"BIT 0": "run"}},
+            "far": {"address": 40020, "type": "INTEGER"},
+        }
+
+    def test_coalesces_and_decodes_mixed_types(self):
+        out = self.reader.read_data_points("plc1", self.points)
+
+        self.assertEqual(self.modbus.requests, [(11, 4), (20, 1)])
+        self.assertEqual(out["count"]["value"], 7)
+        self.assertEqual(out["temp"]["raw_value"], 12.5)
+        self.assertEqual(out["flags"]["value"]["BIT 0"], {"description": "run", "value": False})
+        self.assertEqual(out["flags"]["value"]["BIT 4"]["value"], False)
+        self.assertEqual(out["far"]["value"], 99)
+
+    def test_failed_or_short_blocks_and_invalid_tags_are_omitted(self):
+        points = {**self.points, "bad": {"address": 40030, "type": "BOGUS"}, "no_addr": {"type": "INTEGER"}}
+
+        self.modbus.failing = {20}
+        out = self.reader.read_data_points("plc1", points)
+        self.assertEqual(sorted(out), ["count", "flags", "temp"])
+
+        self.modbus.failing, self.modbus.short = set(), {11}
+        out = self.reader.read_data_points("plc1", points)
+        self.assertEqual(sorted(out), ["far"])
+        self.assertNotIn((30, 1), self.modbus.requests)
+
+    def test_alternating_point_sets_reuse_cached_runs(self):
+        first = {k: self.points[k] for k in ("count", "temp")}
+        second = {k: self.points[k] for k in ("flags", "far")}
+
+        with mock.patch.object(plc_reader, "build_blocks", wraps=plc_reader.build_blocks) as build:
+            for _ in range(3):
+                self.assertEqual(sorted(self.reader.read_data_points("plc1", first)), ["count", "temp"])
+                self.assertEqual(sorted(self.reader.read_data_points("plc1", second)), ["far", "flags"])
+
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(len(self.reader._point_runs), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
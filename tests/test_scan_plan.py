@@ -0,0 +1,96 @@
+import unittest
+
+from sunny_scada.plc_reader import PLCReader
+from sunny_scada.scan_plan import (
+    TYPE_INTEGER,
+    TYPE_REAL,
+    MODBUS_MAX_READ_REGS,
+    build_blocks,
+    build_tag_specs,
+    compile_scaling,
+    group_tags_by_block,
+)
+
+
+def _addr(address_4x: int) -> int:
+    return address_4x - 40001 + 1
+
+
+class ScanPlanTests(unittest.TestCase):
+    def test_compile_scaling_matches_scale_value(self):
+        details = {
+            "raw_zero_scale": 4000,
+            "raw_full_scale": 20000,
+            "eng_zero_scale": -50,
+            "eng_full_scale": 150,
+        }
+        scaling = compile_scaling(details)
+        self.assertIsNotNone(scaling)
+        a, b = scaling
+        for raw in (4000.0, 12000.0, 20000.0, 731.5):
+            expected = PLCReader.scale_value(raw, 4000, 20000, -50, 150)
+            self.assertAlmostEqual(a * raw + b, expected, places=9)
+
+    def test_compile_scaling_none_when_missing_or_degenerate(self):
+        self.assertIsNone(compile_scaling({}))
+        self.assertIsNone(compile_scaling({"raw_zero_scale": 0, "raw_full_scale": 100}))
+        self.assertIsNone(
+            compile_scaling(
+                {"raw_zero_scale": 5, "raw_full_scale": 5, "eng_zero_scale": 0, "eng_full_scale": 1}
+            )
+        )
+
+    def test_build_tag_specs_real_layout(self):
+        tree = {
+            "group": {
+                "TEMP": {
+                    "address": 40010,
+                    "type": "REAL",
+                    "raw_zero_scale": 0,
+                    "raw_full_scale": 100,
+                    "eng_zero_scale": 0,
+                    "eng_full_scale": 10,
+                },
+            },
+            "COUNT": {"address": 40001, "type": "INTEGER"},
+            "ODD": {"address": 40002, "type": "STRING"},
+            "INPUT_REG": {"address": 30001, "type": "INTEGER"},
+        }
+        tags = build_tag_specs(tree, address_4x_to_pymodbus=_addr, real_extra_offset=1)
+
+        self.assertEqual([t.path for t in tags], [("COUNT",), ("group", "TEMP")])
+        self.assertEqual([t.type_id for t in tags], [TYPE_INTEGER, TYPE_REAL])
+        real = tags[1]
+        self.assertEqual(real.base_addr, 10)
+        self.assertEqual(real.read_addr, 11)
+        self.assertEqual(real.length, 2)
+        self.assertTrue(real.scaled)
+        self.assertFalse(tags[0].scaled)
+        self.assertAlmostEqual(real.scale_a, 0.1)
+        self.assertAlmostEqual(real.scale_b, 0.0)
+
+    def test_group_tags_by_block_offsets(self):
+        tree = {
+            "A": {"address": 40001, "type": "INTEGER"},
+            "B": {"address": 40002, "type": "REAL"},
+            "C": {"address": 40200, "type": "DIGITAL"},
+        }
+        tags = build_tag_specs(tree, address_4x_to_pymodbus=_addr, real_extra_offset=1)
+        blocks = build_blocks(tags, max_block_regs=100, max_gap_regs=2)
+        runs = group_tags_by_block(tags, blocks)
+
+        self.assertEqual(len(runs), 2)
+        self.assertEqual([(t.path[-1], off) for t, off in runs[0][1]], [("A", 0), ("B", 2)])
+        self.assertEqual([(t.path[-1], off) for t, off in runs[1][1]], [("C", 0)])
+
+    def test_build_blocks_respects_protocol_limit(self):
+        tree = {f"T{i}": {"address": 40001 + i, "type": "INTEGER"} for i in range(300)}
+        tags = build_tag_specs(tree, address_4x_to_pymodbus=_addr, real_extra_offset=1)
+        blocks = build_blocks(tags, max_block_regs=1000, max_gap_regs=2)
+
+        self.assertTrue(all(b.count <= MODBUS_MAX_READ_REGS for b in blocks))
+        self.assertEqual(sum(b.count for b in blocks), 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import asyncio
+import json
+import unittest
+
+from sunny_scada.services.alarm_broadcaster import AlarmBroadcaster
+
+
+class _FakeWebSocket:
+    def __init__(self, mode: str = "ok") -> None:
+        self.mode = mode
+        self.sent: list[str] = []
+        self.close_codes: list[int] = []
+
+    async def send_text(self, text: str) -> None:
+        if self.mode == "hang":
+            await asyncio.sleep(3600)
+        if self.mode == "raise":
+            raise RuntimeError("socket gone")
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_codes.append(code)
+
+
+class WebSocketBroadcasterTests(unittest.TestCase):
+    def test_failed_and_stalled_clients_are_dropped_and_closed(self):
+        async def run():
+            b = AlarmBroadcaster(asyncio.get_running_loop())
+            ok, hang, bad = _FakeWebSocket(), _FakeWebSocket("hang"), _FakeWebSocket("raise")
+            for ws, key in ((ok, "user:1"), (hang, "user:2"), (bad, "user:3")):
+                await b.add(ws, principal_key=key)
+
+            with self.assertLogs("sunny_scada.services.ws_broadcaster", level="WARNING") as logs:
+                b.broadcast({"type": "alarm_state", "state": "ALARM"})
+                await asyncio.sleep(1.5)
+
+            self.assertEqual([json.loads(t) for t in ok.sent], [{"type": "alarm_state", "state": "ALARM"}])
+            self.assertEqual(list(b._conns), [id(ok)])
+            self.assertEqual((ok.close_codes, hang.close_codes, bad.close_codes), ([], [1011], [1011]))
+            self.assertIn("user:2", "\n".join(logs.output))
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
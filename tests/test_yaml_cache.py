@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+from sunny_scada.yaml_cache import clear_yaml_cache, load_yaml
+
+
+class YamlCacheTests(unittest.TestCase):
+    def test_reuses_parse_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cfg.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("plcs:\n  - name: A\n")
+
+            first = load_yaml(path)
+            self.assertIs(load_yaml(path), first)
+
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("plcs:\n  - name: B\n    ip: 10.0.0.2\n")
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+            second = load_yaml(path)
+            self.assertIsNot(second, first)
+            self.assertEqual(second["plcs"][0]["name"], "B")
+
+    def test_sidecar_is_reused_and_replaced(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = os.path.join(tmp, "cache")
+            path = os.path.join(tmp, "points.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("data_points:\n  T1: {address: 40001, type: INTEGER}\n")
+
+            with mock.patch.dict(os.environ, {"YAML_CACHE_DIR": cache}):
+                clear_yaml_cache()
+                doc = load_yaml(path)
+                sidecars = os.listdir(cache)
+                self.assertEqual(len(sidecars), 1)
+
+                clear_yaml_cache()
+                self.assertEqual(load_yaml(path), doc)
+
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("data_points:\n  T2: {address: 40002, type: REAL}\n")
+                clear_yaml_cache()
+                self.assertIn("T2", load_yaml(path)["data_points"])
+                self.assertEqual(len(os.listdir(cache)), 1)
+                self.assertNotEqual(os.listdir(cache), sidecars)
+
+
+if __name__ == "__main__":
+    unittest.main()